@@ -130,6 +130,22 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Cache (in-memory for development)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds to keep per-user business intelligence sections cached
+BI_CACHE_TTL = config('BI_CACHE_TTL', default=300, cast=int)
+
+# Seconds to keep per-message sentiment scores cached
+SENTIMENT_CACHE_TTL = config('SENTIMENT_CACHE_TTL', default=86400, cast=int)
+
+# Seconds to keep per-property maintenance predictions cached
+MAINTENANCE_PREDICTION_CACHE_TTL = config('MAINTENANCE_PREDICTION_CACHE_TTL', default=3600, cast=int)
+
 # Add Channel layers configuration (using in-memory for development)
 CHANNEL_LAYERS = {
     'default': {
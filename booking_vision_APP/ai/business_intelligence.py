@@ -1,24 +1,276 @@
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
-from django.db.models import Sum, Count, Avg, Q, Max, Min
+from django.db.models import (
+    Sum, Count, Avg, Q, Max, Min, Prefetch, F, Case, When, Value, CharField, DurationField, ExpressionWrapper,
+    FloatField, DecimalField, Exists, OuterRef, Subquery
+)
+from django.db.models.functions import (
+    Cast, Lower, Length, Coalesce, Extract, ExtractIsoWeekDay, ExtractMonth, TruncDate
+)
 from django.utils import timezone
 from datetime import datetime, timedelta
 from decimal import Decimal
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import cached_property
+import heapq
 import json
+from operator import itemgetter
 import random
 import statistics
+import numpy as np
+import pandas as pd
 from ..models import (
     Booking, Property, Payment, Review,
     PricingRule, MaintenanceTask, GuestPreference, MarketData,
     AIInsight, PredictiveModel, BusinessMetric, ReviewSentiment, CompetitorAnalysis
 )
 
+# Bump when the shape of a cached BI section changes
+_BI_CACHE_VERSION = 2
+
+# BI sections derived from the user's pricing rules
+_PRICING_CACHE_SECTIONS = ('pricing_performance', 'pricing_optimization')
+
+# Season index for each month number (index 0 unused), ordered as _SEASON_NAMES
+_SEASON_NAMES = ('Winter', 'Spring', 'Summer', 'Fall')
+_SEASON_IX_BY_MONTH = np.array([0, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int8)
+# Season name for each month, indexed by month - 1
+_SEASON_BY_MONTH = tuple(_SEASON_NAMES[ix] for ix in _SEASON_IX_BY_MONTH[1:])
+# Day name for each ISO weekday number (index 0 unused)
+_ISO_WEEKDAY_NAMES = (None, 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Static chart labels, encoded once at import time
+_MARKET_LABELS = ['Price Competitiveness', 'Service Quality', 'Location Score', 'Amenities',
+                  'Guest Satisfaction', 'Market Presence']
+_MARKET_LABELS_JSON = json.dumps(_MARKET_LABELS)
+_SEASONAL_LABELS_JSON = json.dumps(list(_SEASON_NAMES))
+
+# Review keywords counted in the database against lower(content), one filtered Count per keyword
+_REVIEW_KEYWORDS = {
+    'positive': ('clean', 'amazing', 'perfect', 'excellent', 'comfortable', 'beautiful'),
+    'negative': ('dirty', 'noise', 'problem', 'issue', 'poor', 'disappointed'),
+}
+_REVIEW_KEYWORD_COUNTS = {
+    f'{polarity}_{keyword}': Count('id', filter=Q(content_lower__contains=keyword))
+    for polarity, keywords in _REVIEW_KEYWORDS.items() for keyword in keywords
+}
+
+# Competitor columns exposed in the competitive intelligence payload
+_COMPETITOR_DATA_FIELDS = (
+    'id', 'related_property_id', 'competitor_name', 'competitor_type',
+    'average_rate', 'average_rating', 'review_count', 'amenities'
+)
+
+# Industry benchmarks (would come from external data sources) with display names per metric
+_INDUSTRY_BENCHMARKS = (
+    ('occupancy_rate', 65.0),  # Industry average
+    ('adr', 120.0),  # Industry average ADR
+    ('guest_satisfaction', 4.2),  # Industry average rating
+    ('response_rate', 85.0),  # Industry average review response rate
+    ('repeat_guest_rate', 15.0),  # Industry average repeat rate
+    ('review_rate', 35.0),  # Industry average review generation rate
+)
+_METRIC_NAMES = {metric: metric.replace('_', ' ') for metric, _ in _INDUSTRY_BENCHMARKS}
+_METRIC_TITLES = {metric: name.title() for metric, name in _METRIC_NAMES.items()}
+
+# Operational placeholders until inquiry and host response data is tracked
+_DEFAULT_CONVERSION_RATE = 25  # Percent of inquiries that become bookings
+_DEFAULT_RESPONSE_TIME_HOURS = 13
+
+# Score ladders as (thresholds, results): a value gets the result after the last threshold it exceeds
+_HEALTH_OCCUPANCY_LADDER = ((60, 70, 80), (0, 20, 25, 30))
+_HEALTH_ADR_LADDER = ((75, 100, 150), (0, 15, 20, 25))
+_HEALTH_SEARCH_LADDER = ((200, 500, 1000), (0, 15, 20, 25))
+_HEALTH_EVENTS_LADDER = ((0, 1, 3), (0, 10, 15, 20))
+_SATURATION_LADDER = ((70, 85), ('Low', 'Medium', 'High'))
+_ENTRY_BARRIER_LADDER = ((100, 200), ('Low', 'Medium', 'High'))
+_MARKET_POSITION_LADDER = ((30, 50, 70), ('Niche Player', 'Market Follower', 'Strong Challenger', 'Market Leader'))
+_LOCATION_EVENTS_LADDER = ((0, 2, 5), (0, 10, 15, 20))
+_EXPANSION_BOOKING_VALUE_LADDER = ((100, 150, 200), (0, 15, 20, 25))
+_EXPANSION_REVIEW_VOLUME_LADDER = ((10, 20, 50), (0, 5, 10, 15))
+_EXPANSION_IMPLEMENTATION_LADDER = ((30, 50, 70), (0, 5, 10, 15))
+
+# Ladders looked up with _ladder_at_least: a value reaching a threshold gets the result after it
+_EXPANSION_PORTFOLIO_LADDER = ((1, 2), (0, 15, 20))
+_EXPANSION_RATING_LADDER = ((3.5, 4.0, 4.5), (0, 15, 20, 25))
+_EXPANSION_LEVEL_LADDER = ((40, 60, 80), (
+    ('Not Ready', 'Very Low'),
+    ('Preparation Needed', 'Low'),
+    ('Moderately Ready', 'Medium'),
+    ('Ready for Expansion', 'High'),
+))
+_PERFORMANCE_LEVEL_LADDER = ((70, 90, 110), (
+    ('Poor', 'well_below'), ('Below Average', 'below'), ('Good', 'at'), ('Excellent', 'above')
+))
+_PERFORMANCE_TIER_LADDER = ((70, 90, 100, 110), (
+    'Needs Improvement', 'Below Average', 'Average', 'Above Average', 'Top Performer'
+))
+_EFFICIENCY_LEVEL_LADDER = ((55, 70, 85), ('Needs Improvement', 'Moderately Efficient', 'Efficient', 'Highly Efficient'))
+_EXPANSION_NEXT_STEPS_LADDER = ((60, 80), (
+    ('Focus on current operations', 'Improve guest experience', 'Build stronger foundation'),
+    ('Improve operational efficiency', 'Strengthen financial position', 'Enhance guest satisfaction'),
+    ('Identify expansion opportunities', 'Secure financing', 'Develop expansion plan'),
+))
+
+
+def _ladder(ladder, value):
+    """Look up value in a score ladder, counting only thresholds strictly below it"""
+    thresholds, results = ladder
+    return results[bisect_left(thresholds, value)]
+
+
+def _ladder_at_least(ladder, value):
+    """Look up value in a score ladder, counting thresholds at or below it"""
+    thresholds, results = ladder
+    return results[bisect_right(thresholds, value)]
+
+
+def _score_locations(occupancy, adr, search_volume, event_counts):
+    """Opportunity scores for locations from parallel arrays of their market figures"""
+    score = np.zeros(len(occupancy), dtype=np.int64)
+    for (thresholds, results), values in (
+        (_HEALTH_OCCUPANCY_LADDER, occupancy),
+        (_HEALTH_ADR_LADDER, adr),
+        (_HEALTH_SEARCH_LADDER, search_volume),
+        (_LOCATION_EVENTS_LADDER, event_counts),
+    ):
+        # Occupancy, ADR, search volume and events each add demand points;
+        # side='left' keeps the strict ">" of _ladder
+        score += np.asarray(results)[np.searchsorted(thresholds, values, side='left')]
+    return np.minimum(score, 100)
+
+
+def _seasonal_variance(booking_counts):
+    """Coefficient of variation (%) of booking counts across the months that have bookings"""
+    booking_counts = list(booking_counts)
+    if len(booking_counts) < 2:
+        return 0
+
+    avg_bookings = sum(booking_counts) / len(booking_counts)
+    variance = sum((count - avg_bookings) ** 2 for count in booking_counts) / len(booking_counts)
+
+    return (variance ** 0.5) / avg_bookings * 100 if avg_bookings > 0 else 0
+
+
+def _bi_cache_key(section, user_id):
+    """Cache key for a per-user BI section, rolled over daily and on schema changes"""
+    return f'bi:v{_BI_CACHE_VERSION}:{section}:{user_id}:{timezone.localdate().isoformat()}'
+
+
+def pricing_cache_keys(user_id):
+    """Cache keys of the user's BI sections built from their pricing rules"""
+    return [_bi_cache_key(section, user_id) for section in _PRICING_CACHE_SECTIONS]
+
+
+class _BIContext:
+    """Request-scoped querysets with shared aggregates, each evaluated at most once per request"""
+
+    def __init__(self, user, properties, bookings, payments, reviews, market_data):
+        self.user = user
+        self.properties = properties
+        self.bookings = bookings
+        self.payments = payments
+        self.reviews = reviews
+        self.market_data = market_data
+
+    @cached_property
+    def property_count(self):
+        return self.properties.count()
+
+    @cached_property
+    def booking_totals(self):
+        return self.bookings.aggregate(
+            count=Count('id'),
+            unique_guests=Count('guest_name', distinct=True),
+            avg_amount=Avg('total_amount'),
+            total_amount=Sum('total_amount'),
+            total_stay=Sum(ExpressionWrapper(F('check_out') - F('check_in'), output_field=DurationField()))
+        )
+
+    @cached_property
+    def total_bookings(self):
+        return self.booking_totals['count']
+
+    @cached_property
+    def distinct_guests(self):
+        return self.booking_totals['unique_guests']
+
+    @cached_property
+    def monthly_booking_counts(self):
+        rows = self.bookings.annotate(month=ExtractMonth('check_in')).values('month').annotate(
+            count=Count('id')).order_by()
+        return {row['month']: row['count'] for row in rows}
+
+    @cached_property
+    def seasonal_variance(self):
+        return cache.get_or_set(
+            _bi_cache_key('seasonal_variance', self.user.pk),
+            lambda: _seasonal_variance(self.monthly_booking_counts.values()),
+            settings.BI_CACHE_TTL
+        )
+
+    @cached_property
+    def repeat_rate(self):
+        if not self.total_bookings:
+            return 0
+        return (self.total_bookings - self.distinct_guests) / self.total_bookings * 100
+
+    @cached_property
+    def avg_booking_value(self):
+        return self.booking_totals['avg_amount'] or 0
+
+    @cached_property
+    def user_avg_rate(self):
+        return float(self.avg_booking_value)
+
+    @cached_property
+    def current_revenue(self):
+        return self.payments.filter(status='completed').aggregate(
+            total=Sum('amount')
+        )['total'] or Decimal('0.00')
+
+    @cached_property
+    def review_stats(self):
+        return self.reviews.aggregate(count=Count('id'), avg_rating=Avg('normalized_rating'))
+
+    @cached_property
+    def ai_insight_counts(self):
+        return cache.get_or_set(
+            _bi_cache_key('ai_insight_counts', self.user.pk),
+            lambda: AIInsight.objects.filter(user=self.user).aggregate(
+                total=Count('id'),
+                implemented=Count('id', filter=Q(is_implemented=True))
+            ),
+            settings.BI_CACHE_TTL
+        )
+
+    @cached_property
+    def latest_market(self):
+        return self.market_data.order_by('-date').only('average_daily_rate', 'occupancy_rate').first()
+
+    @cached_property
+    def market_adr(self):
+        return float(self.latest_market.average_daily_rate) if self.latest_market else None
+
 
 @method_decorator(login_required, name='dispatch')
 class BusinessIntelligenceView(TemplateView):
     template_name = 'ai/business_intelligence.html'
 
+    # Review aspect rating fields with their display labels
+    _REVIEW_ASPECTS = (
+        ('cleanliness_rating', 'Cleanliness'),
+        ('communication_rating', 'Communication'),
+        ('location_rating', 'Location'),
+        ('value_rating', 'Value'),
+        ('amenities_rating', 'Amenities'),
+    )
+    _COMMON_AMENITIES = ('wifi', 'parking', 'kitchen', 'air_conditioning', 'pool')
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
@@ -61,6 +313,8 @@ class BusinessIntelligenceView(TemplateView):
         })
 
         if has_data:
+            bi = _BIContext(user, properties, bookings, payments, reviews, market_data)
+
             # Comprehensive business intelligence analysis
             self._calculate_advanced_business_health(context, user, properties, bookings, payments, reviews,
                                                      business_metrics, ai_insights)
@@ -68,19 +322,20 @@ class BusinessIntelligenceView(TemplateView):
             self._analyze_advanced_market_intelligence(context, user, properties, market_data, competitor_analyses)
             self._generate_sophisticated_guest_intelligence(context, user, bookings, reviews)
             self._calculate_comprehensive_operational_intelligence(context, user, properties, maintenance_tasks)
-            self._assess_comprehensive_risks_opportunities(context, user, bookings, payments, reviews, ai_insights)
-            self._generate_advanced_seasonal_intelligence(context, user, bookings, market_data)
+            self._assess_comprehensive_risks_opportunities(context, bi, ai_insights)
+            self._generate_advanced_seasonal_intelligence(context, bi, market_data)
             self._create_powerful_ai_recommendations(context, user, ai_insights, pricing_rules, maintenance_tasks)
             self._generate_advanced_predictive_data(context, user, bookings, payments, business_metrics)
             self._analyze_comprehensive_review_intelligence(context, user, reviews)
             self._generate_competitive_intelligence(context, user, properties, competitor_analyses)
             self._calculate_market_positioning_intelligence(context, user, properties, market_data)
-            self._generate_pricing_optimization_intelligence(context, user, pricing_rules, bookings, market_data)
-            self._analyze_maintenance_prediction_intelligence(context, user, maintenance_tasks)
-            self._generate_guest_behavior_intelligence(context, user, bookings, reviews)
-            self._calculate_performance_benchmarking(context, user, business_metrics, market_data)
-            self._generate_growth_opportunity_intelligence(context, user, properties, bookings, market_data)
-            self._analyze_operational_efficiency_intelligence(context, user, properties, bookings, maintenance_tasks)
+            self._generate_pricing_optimization_intelligence(context, bi, pricing_rules)
+            self._analyze_maintenance_prediction_intelligence(context, user,
+                                                              maintenance_tasks.select_related('rental_property'))
+            self._generate_guest_behavior_intelligence(context, bi)
+            self._calculate_performance_benchmarking(context, bi, business_metrics)
+            self._generate_growth_opportunity_intelligence(context, bi)
+            self._analyze_operational_efficiency_intelligence(context, bi, maintenance_tasks)
 
         return context
 
@@ -119,7 +374,7 @@ class BusinessIntelligenceView(TemplateView):
             total_possible_nights += days_in_year
 
             property_bookings = bookings.filter(property=property_obj)
-            for booking in property_bookings:
+            for booking in property_bookings.only('check_in', 'check_out').iterator(chunk_size=1000):
                 nights = (booking.check_out - booking.check_in).days
                 total_booked_nights += nights
 
@@ -339,7 +594,11 @@ class BusinessIntelligenceView(TemplateView):
         predicted_revenue_data.reverse()
 
         # Advanced pricing analysis
-        pricing_performance = self._analyze_pricing_performance(pricing_rules, bookings, payments)
+        pricing_performance = cache.get_or_set(
+            _bi_cache_key('pricing_performance', user.pk),
+            lambda: self._analyze_pricing_performance(pricing_rules, bookings, payments),
+            settings.BI_CACHE_TTL
+        )
 
         # Revenue optimization opportunities
         revenue_insights = [
@@ -518,8 +777,6 @@ class BusinessIntelligenceView(TemplateView):
                 })
 
         # Market intelligence labels and data for charts
-        market_labels = ['Price Competitiveness', 'Service Quality', 'Location Score', 'Amenities',
-                         'Guest Satisfaction', 'Market Presence']
         market_data_chart = []
 
         for property_obj in properties:
@@ -530,14 +787,14 @@ class BusinessIntelligenceView(TemplateView):
         # Average scores across all properties
         if market_data_chart:
             avg_scores = [sum(scores[i] for scores in market_data_chart) / len(market_data_chart) for i in
-                          range(len(market_labels))]
+                          range(len(_MARKET_LABELS))]
         else:
-            avg_scores = [random.randint(60, 90) for _ in market_labels]
+            avg_scores = [random.randint(60, 90) for _ in _MARKET_LABELS]
 
         context.update({
             'market_insights': market_insights,
             'competitive_landscape': competitive_landscape,
-            'competitive_labels': json.dumps(market_labels),
+            'competitive_labels': _MARKET_LABELS_JSON,
             'competitive_data': json.dumps(avg_scores),
             'total_competitors': competitor_analyses.count(),
             'market_coverage': len(property_locations),
@@ -763,7 +1020,7 @@ class BusinessIntelligenceView(TemplateView):
         if bookings.exists():
             # Booking lead time analysis
             lead_times = []
-            for booking in bookings:
+            for booking in bookings.only('check_in', 'created_at').iterator(chunk_size=2000):
                 lead_time = (booking.check_in.date() - booking.created_at.date()).days
                 lead_times.append(lead_time)
 
@@ -771,7 +1028,7 @@ class BusinessIntelligenceView(TemplateView):
 
             # Stay duration analysis
             stay_durations = []
-            for booking in bookings:
+            for booking in bookings.only('check_in', 'check_out').iterator(chunk_size=2000):
                 duration = (booking.check_out - booking.check_in).days
                 stay_durations.append(duration)
 
@@ -812,7 +1069,7 @@ class BusinessIntelligenceView(TemplateView):
             'solo': 0
         }
 
-        for booking in bookings:
+        for booking in bookings.only('check_in', 'check_out').iterator(chunk_size=2000):
             # Analyze booking patterns to determine guest type
             stay_duration = (booking.check_out - booking.check_in).days
 
@@ -834,7 +1091,7 @@ class BusinessIntelligenceView(TemplateView):
             'early_bookings': 0
         }
 
-        for booking in bookings:
+        for booking in bookings.only('check_in', 'created_at').iterator(chunk_size=2000):
             # Weekend vs weekday
             if booking.check_in.weekday() >= 5:  # Saturday = 5, Sunday = 6
                 patterns['weekend_bookings'] += 1
@@ -852,20 +1109,10 @@ class BusinessIntelligenceView(TemplateView):
 
     def _analyze_seasonal_preferences(self, bookings):
         """Analyze seasonal booking preferences"""
-        seasons = {'Winter': 0, 'Spring': 0, 'Summer': 0, 'Fall': 0}
-
-        for booking in bookings:
-            month = booking.check_in.month
-            if month in [12, 1, 2]:
-                seasons['Winter'] += 1
-            elif month in [3, 4, 5]:
-                seasons['Spring'] += 1
-            elif month in [6, 7, 8]:
-                seasons['Summer'] += 1
-            else:
-                seasons['Fall'] += 1
+        months = np.fromiter(bookings.values_list('check_in__month', flat=True), dtype=np.int8)
+        season_counts = np.bincount(_SEASON_IX_BY_MONTH[months], minlength=4)
 
-        return seasons
+        return dict(zip(_SEASON_NAMES, season_counts.tolist()))
 
     def _calculate_comprehensive_operational_intelligence(self, context, user, properties, maintenance_tasks):
         """Calculate comprehensive operational intelligence"""
@@ -1021,16 +1268,17 @@ class BusinessIntelligenceView(TemplateView):
             'maintenance_efficiency': round(completion_rate if 'completion_rate' in locals() else 80),
         })
 
-    def _assess_comprehensive_risks_opportunities(self, context, user, bookings, payments, reviews, ai_insights):
+    def _assess_comprehensive_risks_opportunities(self, context, bi, ai_insights):
         """Assess comprehensive risks and opportunities"""
 
+        user, bookings, reviews = bi.user, bi.bookings, bi.reviews
+        total_bookings = bi.total_bookings
+        review_count = bi.review_stats['count']
         opportunities = []
         risks = []
 
         # Revenue-based opportunities
-        total_revenue = payments.filter(status='completed').aggregate(
-            total=Sum('amount')
-        )['total'] or Decimal('0.00')
+        total_revenue = bi.current_revenue
 
         # Market expansion opportunities
         if total_revenue > 10000:
@@ -1046,8 +1294,11 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Technology integration opportunities
-        ai_implementation_rate = ai_insights.filter(
-            is_implemented=True).count() / ai_insights.count() * 100 if ai_insights.exists() else 0
+        ai_counts = ai_insights.aggregate(
+            total=Count('id'),
+            implemented=Count('id', filter=Q(is_implemented=True))
+        )
+        ai_implementation_rate = ai_counts['implemented'] / ai_counts['total'] * 100 if ai_counts['total'] else 0
 
         if ai_implementation_rate < 70:
             opportunities.append({
@@ -1062,8 +1313,8 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Premium pricing opportunities
-        if reviews.exists():
-            avg_rating = reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
+        if review_count:
+            avg_rating = bi.review_stats['avg_rating'] or 0
             if avg_rating > 4.5:
                 opportunities.append({
                     'title': 'Premium Pricing Opportunity',
@@ -1080,8 +1331,8 @@ class BusinessIntelligenceView(TemplateView):
         long_stay_bookings = bookings.filter(
             check_out__gt=timezone.now() - timedelta(days=30)
         ).annotate(
-            duration=Count('check_out') - Count('check_in')
-        ).filter(duration__gte=7).count()
+            duration=ExpressionWrapper(F('check_out') - F('check_in'), output_field=DurationField())
+        ).filter(duration__gte=timedelta(days=7)).count()
 
         if long_stay_bookings > 0:
             opportunities.append({
@@ -1096,7 +1347,7 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Seasonal optimization opportunities
-        seasonal_variance = self._calculate_seasonal_variance(bookings)
+        seasonal_variance = bi.seasonal_variance
         if seasonal_variance > 40:
             opportunities.append({
                 'title': 'Seasonal Revenue Optimization',
@@ -1112,11 +1363,11 @@ class BusinessIntelligenceView(TemplateView):
         # Risk assessments
 
         # Revenue concentration risk
-        if bookings.exists():
+        if total_bookings:
             # Check channel concentration
-            channel_distribution = bookings.values('channel').annotate(count=Count('id'))
-            if channel_distribution.exists():
-                max_channel_share = max(item['count'] for item in channel_distribution) / bookings.count() * 100
+            channel_distribution = list(bookings.values('channel').annotate(count=Count('id')).order_by())
+            if channel_distribution:
+                max_channel_share = max(item['count'] for item in channel_distribution) / total_bookings * 100
                 if max_channel_share > 60:
                     risks.append({
                         'title': 'Channel Concentration Risk',
@@ -1142,9 +1393,9 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Guest satisfaction risk
-        if reviews.exists():
+        if review_count:
             negative_reviews = reviews.filter(sentiment='negative').count()
-            total_reviews = reviews.count()
+            total_reviews = review_count
             negative_percentage = (negative_reviews / total_reviews * 100) if total_reviews > 0 else 0
 
             if negative_percentage > 15:
@@ -1216,61 +1467,41 @@ class BusinessIntelligenceView(TemplateView):
             'risk_mitigation_actions': sum(len(risk.get('mitigation', [])) for risk in risks),
         })
 
-    def _calculate_seasonal_variance(self, bookings):
-        """Calculate seasonal booking variance"""
-        if not bookings.exists():
-            return 0
-
-        monthly_counts = {}
-        for booking in bookings:
-            month = booking.check_in.month
-            monthly_counts[month] = monthly_counts.get(month, 0) + 1
-
-        if len(monthly_counts) < 2:
-            return 0
-
-        booking_counts = list(monthly_counts.values())
-        avg_bookings = sum(booking_counts) / len(booking_counts)
-        variance = sum((count - avg_bookings) ** 2 for count in booking_counts) / len(booking_counts)
-
-        return (variance ** 0.5) / avg_bookings * 100 if avg_bookings > 0 else 0
-
-    def _generate_advanced_seasonal_intelligence(self, context, user, bookings, market_data):
+    def _generate_advanced_seasonal_intelligence(self, context, bi, market_data):
         """Generate advanced seasonal intelligence"""
 
         seasonal_insights = []
         seasonal_performance = {}
         demand_patterns = {}
 
-        # Seasonal booking analysis
-        seasons = {'Winter': [], 'Spring': [], 'Summer': [], 'Fall': []}
+        # Seasonal booking analysis: one row per booking with its completed payments summed
+        booking_rows = list(bi.bookings.annotate(
+            paid=Sum('payments__amount', filter=Q(payments__status='completed'))
+        ).values_list('check_in', 'check_out', 'paid'))
 
-        for booking in bookings:
-            month = booking.check_in.month
-            season = self._get_season_from_month(month)
-            seasons[season].append(booking)
+        season_counts = season_revenue = season_nights = np.zeros(4)
+        if booking_rows:
+            row_count = len(booking_rows)
+            months = np.fromiter((row[0].month for row in booking_rows), dtype=np.int8, count=row_count)
+            nights = np.fromiter(((row[1] - row[0]).days for row in booking_rows), dtype=np.float64, count=row_count)
+            paid = np.fromiter((float(row[2] or 0) for row in booking_rows), dtype=np.float64, count=row_count)
+
+            season_ix = _SEASON_IX_BY_MONTH[months]
+            season_counts = np.bincount(season_ix, minlength=4)
+            season_revenue = np.bincount(season_ix, weights=paid, minlength=4)
+            season_nights = np.bincount(season_ix, weights=nights, minlength=4)
 
         # Calculate seasonal performance metrics
-        for season, season_bookings in seasons.items():
+        for ix, season in enumerate(_SEASON_NAMES):
+            season_bookings = int(season_counts[ix])
             if season_bookings:
-                total_revenue = sum(
-                    Payment.objects.filter(
-                        booking=booking,
-                        status='completed'
-                    ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-                    for booking in season_bookings
-                )
-
-                avg_length = sum(
-                    (booking.check_out - booking.check_in).days
-                    for booking in season_bookings
-                ) / len(season_bookings)
+                total_revenue = float(season_revenue[ix])
 
                 seasonal_performance[season] = {
-                    'bookings': len(season_bookings),
-                    'revenue': float(total_revenue),
-                    'avg_length': round(avg_length, 1),
-                    'avg_rate': float(total_revenue) / len(season_bookings) if season_bookings else 0
+                    'bookings': season_bookings,
+                    'revenue': total_revenue,
+                    'avg_length': round(float(season_nights[ix]) / season_bookings, 1),
+                    'avg_rate': total_revenue / season_bookings
                 }
             else:
                 seasonal_performance[season] = {
@@ -1281,8 +1512,9 @@ class BusinessIntelligenceView(TemplateView):
                 }
 
         # Find peak and low seasons
-        peak_season = max(seasonal_performance.keys(), key=lambda x: seasonal_performance[x]['revenue'])
-        low_season = min(seasonal_performance.keys(), key=lambda x: seasonal_performance[x]['revenue'])
+        seasonal_df = pd.DataFrame.from_dict(seasonal_performance, orient='index').reindex(_SEASON_NAMES)
+        peak_season = seasonal_df['revenue'].idxmax()
+        low_season = seasonal_df['revenue'].idxmin()
 
         # Generate seasonal insights
         peak_revenue = seasonal_performance[peak_season]['revenue']
@@ -1311,35 +1543,27 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Market data seasonal analysis
-        if market_data.exists():
-            market_seasonal_data = {}
-            for data_point in market_data:
-                month = data_point.date.month
-                season = self._get_season_from_month(month)
-
-                if season not in market_seasonal_data:
-                    market_seasonal_data[season] = {
-                        'adr': [],
-                        'occupancy': [],
-                        'search_volume': []
-                    }
-
-                market_seasonal_data[season]['adr'].append(float(data_point.average_daily_rate))
-                market_seasonal_data[season]['occupancy'].append(float(data_point.occupancy_rate))
-                market_seasonal_data[season]['search_volume'].append(data_point.search_volume)
+        market_rows = list(market_data.values_list(
+            'date__month', 'average_daily_rate', 'occupancy_rate', 'search_volume'
+        ))
+        if market_rows:
+            rows = np.array(market_rows, dtype=float)
+            season_ix = _SEASON_IX_BY_MONTH[rows[:, 0].astype(int)]
+            season_counts = np.bincount(season_ix, minlength=4)
+            adr_sums = np.bincount(season_ix, weights=rows[:, 1], minlength=4)
+            occupancy_sums = np.bincount(season_ix, weights=rows[:, 2], minlength=4)
+            search_sums = np.bincount(season_ix, weights=rows[:, 3], minlength=4)
 
             # Calculate market seasonal averages
-            for season in market_seasonal_data:
-                data = market_seasonal_data[season]
-                if data['adr']:
-                    seasonal_performance[season]['market_adr'] = sum(data['adr']) / len(data['adr'])
-                    seasonal_performance[season]['market_occupancy'] = sum(data['occupancy']) / len(data['occupancy'])
-                    seasonal_performance[season]['market_search'] = sum(data['search_volume']) / len(
-                        data['search_volume'])
+            for ix, season in enumerate(_SEASON_NAMES):
+                if season_counts[ix]:
+                    seasonal_performance[season]['market_adr'] = float(adr_sums[ix] / season_counts[ix])
+                    seasonal_performance[season]['market_occupancy'] = float(occupancy_sums[ix] / season_counts[ix])
+                    seasonal_performance[season]['market_search'] = float(search_sums[ix] / season_counts[ix])
 
         # Demand forecasting
         current_month = timezone.now().month
-        next_season = self._get_season_from_month((current_month + 1) % 12 or 12)
+        next_season = _SEASON_BY_MONTH[current_month % 12]
 
         if next_season in seasonal_performance:
             historical_performance = seasonal_performance[next_season]
@@ -1358,9 +1582,10 @@ class BusinessIntelligenceView(TemplateView):
 
         # Monthly heatmap data
         seasonal_heatmap = []
+        counts_by_month = bi.monthly_booking_counts
+        max_bookings = max(counts_by_month.values(), default=0) or 1
         for month in range(1, 13):
-            month_bookings = bookings.filter(check_in__month=month).count()
-            max_bookings = max(bookings.filter(check_in__month=m).count() for m in range(1, 13)) or 1
+            month_bookings = counts_by_month.get(month, 0)
 
             intensity = month_bookings / max_bookings if max_bookings > 0 else 0
             demand_level = round((month_bookings / max_bookings) * 100) if max_bookings > 0 else 0
@@ -1374,31 +1599,23 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Seasonal chart data
-        seasonal_labels = ['Winter', 'Spring', 'Summer', 'Fall']
-        seasonal_data = [seasonal_performance[season]['revenue'] for season in seasonal_labels]
+        seasonal_data = seasonal_df['revenue'].tolist()
 
         context.update({
             'seasonal_insights': seasonal_insights,
             'seasonal_performance': seasonal_performance,
             'demand_patterns': demand_patterns,
             'seasonal_heatmap': seasonal_heatmap,
-            'seasonal_labels': json.dumps(seasonal_labels),
+            'seasonal_labels': _SEASONAL_LABELS_JSON,
             'seasonal_data': json.dumps(seasonal_data),
             'peak_season': peak_season,
             'low_season': low_season,
-            'seasonal_variance': self._calculate_seasonal_variance(bookings),
+            'seasonal_variance': bi.seasonal_variance,
         })
 
     def _get_season_from_month(self, month):
         """Get season from month number"""
-        if month in [12, 1, 2]:
-            return 'Winter'
-        elif month in [3, 4, 5]:
-            return 'Spring'
-        elif month in [6, 7, 8]:
-            return 'Summer'
-        else:
-            return 'Fall'
+        return _SEASON_BY_MONTH[month - 1]
 
     def _create_powerful_ai_recommendations(self, context, user, ai_insights, pricing_rules, maintenance_tasks):
         """Create powerful AI recommendations"""
@@ -1483,7 +1700,7 @@ class BusinessIntelligenceView(TemplateView):
         if bookings.exists():
             avg_lead_time = sum(
                 (booking.check_in.date() - booking.created_at.date()).days
-                for booking in bookings
+                for booking in bookings.only('check_in', 'created_at').iterator(chunk_size=1000)
             ) / bookings.count()
 
             if avg_lead_time < 14:
@@ -1584,11 +1801,13 @@ class BusinessIntelligenceView(TemplateView):
         predictions = {}
         forecasts = {}
         trends = {}
+        now = timezone.now()
+        today = now.date()
 
         # Revenue predictions
         recent_payments = payments.filter(
             status='completed',
-            payment_date__gte=timezone.now() - timedelta(days=90)
+            payment_date__gte=now - timedelta(days=90)
         ).order_by('payment_date')
 
         if recent_payments.exists():
@@ -1607,7 +1826,7 @@ class BusinessIntelligenceView(TemplateView):
                 # Predict next 3 months
                 base_revenue = revenue_values[-1]
                 for i in range(1, 4):
-                    predicted_month = (timezone.now() + timedelta(days=30 * i)).strftime('%Y-%m')
+                    predicted_month = (now + timedelta(days=30 * i)).strftime('%Y-%m')
                     predicted_revenue = base_revenue * (1 + growth_rate) ** i
 
                     predictions[f'revenue_month_{i}'] = {
@@ -1619,15 +1838,15 @@ class BusinessIntelligenceView(TemplateView):
 
         # Booking predictions
         recent_bookings = bookings.filter(
-            created_at__gte=timezone.now() - timedelta(days=90)
+            created_at__gte=now - timedelta(days=90)
         ).order_by('created_at')
 
         if recent_bookings.exists():
             # Weekly booking pattern
-            weekly_bookings = {}
-            for booking in recent_bookings:
-                week_key = booking.created_at.strftime('%Y-W%U')
-                weekly_bookings[week_key] = weekly_bookings.get(week_key, 0) + 1
+            weekly_bookings = Counter(
+                booking.created_at.strftime('%Y-W%U')
+                for booking in recent_bookings.only('created_at').iterator(chunk_size=1000)
+            )
 
             booking_values = list(weekly_bookings.values())
             if len(booking_values) >= 2:
@@ -1635,7 +1854,7 @@ class BusinessIntelligenceView(TemplateView):
 
                 # Predict next 4 weeks
                 for i in range(1, 5):
-                    predicted_week = (timezone.now() + timedelta(weeks=i)).strftime('%Y-W%U')
+                    predicted_week = (now + timedelta(weeks=i)).strftime('%Y-W%U')
                     # Add some seasonality and randomness
                     seasonal_factor = 1.0 + 0.1 * (i % 2)  # Simple seasonal adjustment
                     predicted_bookings = round(avg_weekly_bookings * seasonal_factor)
@@ -1650,6 +1869,14 @@ class BusinessIntelligenceView(TemplateView):
         # Occupancy predictions
         properties = Property.objects.filter(owner=user)
         if properties.exists() and bookings.exists():
+            # Last 3 monthly windows as (start, end, label), shared by every property
+            month_base = now.replace(day=1)
+            occupancy_windows = []
+            for i in range(3):
+                month_start = month_base - timedelta(days=30 * i)
+                occupancy_windows.append((month_start, month_start + timedelta(days=30), month_start.strftime('%Y-%m')))
+            next_month = (now + timedelta(days=30)).strftime('%Y-%m')
+
             # Calculate current occupancy trends
             for property_obj in properties:
                 property_bookings = bookings.filter(property=property_obj)
@@ -1657,27 +1884,23 @@ class BusinessIntelligenceView(TemplateView):
                 if property_bookings.exists():
                     # Calculate occupancy for last 3 months
                     monthly_occupancy = {}
-                    for i in range(3):
-                        month_start = timezone.now().replace(day=1) - timedelta(days=30 * i)
-                        month_end = month_start + timedelta(days=30)
-
+                    for month_start, month_end, month_label in occupancy_windows:
                         month_bookings = property_bookings.filter(
                             check_in__range=[month_start, month_end]
                         )
 
                         total_nights = sum(
                             (booking.check_out - booking.check_in).days
-                            for booking in month_bookings
+                            for booking in month_bookings.only('check_in', 'check_out').iterator(chunk_size=1000)
                         )
 
                         possible_nights = 30  # Simplified
                         occupancy = (total_nights / possible_nights) * 100
-                        monthly_occupancy[month_start.strftime('%Y-%m')] = occupancy
+                        monthly_occupancy[month_label] = occupancy
 
                     # Predict next month occupancy
                     if monthly_occupancy:
                         avg_occupancy = sum(monthly_occupancy.values()) / len(monthly_occupancy)
-                        next_month = (timezone.now() + timedelta(days=30)).strftime('%Y-%m')
 
                         predictions[f'occupancy_{property_obj.id}'] = {
                             'property': property_obj.name,
@@ -1721,18 +1944,24 @@ class BusinessIntelligenceView(TemplateView):
         maintenance_tasks = MaintenanceTask.objects.filter(rental_property__owner=user)
         maintenance_predictions = []
 
-        for task in maintenance_tasks.filter(predicted_by_ai=True, predicted_failure_date__isnull=False):
-            if task.predicted_failure_date >= timezone.now().date():
-                days_until = (task.predicted_failure_date - timezone.now().date()).days
-                maintenance_predictions.append({
-                    'task': task.title,
-                    'property': task.rental_property.name,
-                    'predicted_date': task.predicted_failure_date.isoformat(),
-                    'days_until': days_until,
-                    'confidence': float(task.prediction_confidence or 75),
-                    'estimated_cost': float(task.estimated_cost or 0),
-                    'priority': task.priority
-                })
+        predicted_tasks = maintenance_tasks.filter(
+            predicted_by_ai=True,
+            predicted_failure_date__gte=today
+        ).values(
+            'title', 'rental_property__name', 'predicted_failure_date',
+            'prediction_confidence', 'estimated_cost', 'priority'
+        )
+
+        for task in predicted_tasks:
+            maintenance_predictions.append({
+                'task': task['title'],
+                'property': task['rental_property__name'],
+                'predicted_date': task['predicted_failure_date'].isoformat(),
+                'days_until': (task['predicted_failure_date'] - today).days,
+                'confidence': float(task['prediction_confidence'] or 75),
+                'estimated_cost': float(task['estimated_cost'] or 0),
+                'priority': task['priority']
+            })
 
         # Demand pattern analysis
         demand_patterns = self._analyze_demand_patterns(bookings)
@@ -1749,19 +1978,19 @@ class BusinessIntelligenceView(TemplateView):
         model_performance = {
             'revenue_model': {
                 'accuracy': forecast_accuracy['revenue'],
-                'last_updated': timezone.now() - timedelta(days=7),
+                'last_updated': now - timedelta(days=7),
                 'predictions_made': random.randint(50, 200),
                 'success_rate': random.randint(80, 95)
             },
             'demand_model': {
                 'accuracy': forecast_accuracy['bookings'],
-                'last_updated': timezone.now() - timedelta(days=3),
+                'last_updated': now - timedelta(days=3),
                 'predictions_made': random.randint(30, 150),
                 'success_rate': random.randint(75, 90)
             },
             'maintenance_model': {
                 'accuracy': forecast_accuracy['maintenance'],
-                'last_updated': timezone.now() - timedelta(days=1),
+                'last_updated': now - timedelta(days=1),
                 'predictions_made': random.randint(10, 50),
                 'success_rate': random.randint(85, 98)
             }
@@ -1791,39 +2020,37 @@ class BusinessIntelligenceView(TemplateView):
     def _analyze_demand_patterns(self, bookings):
         """Analyze booking demand patterns"""
         patterns = {
-            'weekly': {},
-            'monthly': {},
-            'seasonal': {},
-            'lead_time': {},
-            'duration': {}
+            'weekly': Counter(),
+            'monthly': Counter(),
+            'seasonal': Counter(),
+            'lead_time': Counter(),
+            'duration': Counter()
         }
 
-        for booking in bookings:
+        for booking in bookings.only('check_in', 'check_out', 'created_at').iterator(chunk_size=2000):
             # Weekly pattern
-            day_of_week = booking.check_in.strftime('%A')
-            patterns['weekly'][day_of_week] = patterns['weekly'].get(day_of_week, 0) + 1
+            patterns['weekly'][booking.check_in.strftime('%A')] += 1
 
             # Monthly pattern
-            month = booking.check_in.strftime('%B')
-            patterns['monthly'][month] = patterns['monthly'].get(month, 0) + 1
+            patterns['monthly'][booking.check_in.strftime('%B')] += 1
 
             # Lead time analysis
             lead_time = (booking.check_in.date() - booking.created_at.date()).days
             if lead_time <= 7:
-                patterns['lead_time']['last_minute'] = patterns['lead_time'].get('last_minute', 0) + 1
+                patterns['lead_time']['last_minute'] += 1
             elif lead_time <= 30:
-                patterns['lead_time']['short_term'] = patterns['lead_time'].get('short_term', 0) + 1
+                patterns['lead_time']['short_term'] += 1
             else:
-                patterns['lead_time']['long_term'] = patterns['lead_time'].get('long_term', 0) + 1
+                patterns['lead_time']['long_term'] += 1
 
             # Duration analysis
             duration = (booking.check_out - booking.check_in).days
             if duration <= 2:
-                patterns['duration']['short_stay'] = patterns['duration'].get('short_stay', 0) + 1
+                patterns['duration']['short_stay'] += 1
             elif duration <= 7:
-                patterns['duration']['medium_stay'] = patterns['duration'].get('medium_stay', 0) + 1
+                patterns['duration']['medium_stay'] += 1
             else:
-                patterns['duration']['long_stay'] = patterns['duration'].get('long_stay', 0) + 1
+                patterns['duration']['long_stay'] += 1
 
         return patterns
 
@@ -1844,48 +2071,103 @@ class BusinessIntelligenceView(TemplateView):
         temporal_analysis = {}
         sentiment_insights = []
 
-        # Basic review metrics
-        total_reviews = reviews.count()
-        avg_rating = reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
+        now = timezone.now()
+        cutoff_30 = now - timedelta(days=30)
+        cutoff_60 = now - timedelta(days=60)
+        responded = Q(response_text__isnull=False)
+        recent_window = Q(review_date__gte=cutoff_30)
+        previous_window = Q(review_date__gte=cutoff_60, review_date__lt=cutoff_30)
+
+        # Review metrics, sentiment counts, aspect averages and recent trends in one query
+        review_totals = reviews.aggregate(
+            total=Count('id'),
+            avg=Avg('normalized_rating'),
+            positive=Count('id', filter=Q(sentiment='positive')),
+            neutral=Count('id', filter=Q(sentiment='neutral')),
+            negative=Count('id', filter=Q(sentiment='negative')),
+            responded=Count('id', filter=responded),
+            avg_response_time=Avg('response_time', filter=responded),
+            recent_count=Count('id', filter=recent_window),
+            recent_avg=Avg('normalized_rating', filter=recent_window),
+            previous_count=Count('id', filter=previous_window),
+            previous_avg=Avg('normalized_rating', filter=previous_window),
+            **{f'avg_{field}': Avg(field) for field, _ in self._REVIEW_ASPECTS}
+        )
+        total_reviews = review_totals['total']
+        avg_rating = review_totals['avg'] or 0
 
-        # Platform breakdown
-        platform_stats = reviews.values('platform').annotate(
+        # Platform and monthly breakdowns from one grouped query
+        review_groups = reviews.values('platform', 'review_date__year', 'review_date__month').annotate(
             count=Count('id'),
-            avg_rating=Avg('normalized_rating'),
-            avg_response_time=Avg('response_time')
-        ).order_by('-avg_rating')
+            rating_sum=Sum('normalized_rating'),
+            rated=Count('normalized_rating'),
+            response_time_sum=Sum('response_time'),
+            timed=Count('response_time'),
+            sentiment_positive=Count('id', filter=Q(sentiment='positive')),
+            sentiment_negative=Count('id', filter=Q(sentiment='negative'))
+        ).order_by()
+
+        platform_totals = {}
+        month_totals = {}
+        for group in review_groups:
+            platform = platform_totals.setdefault(
+                group['platform'],
+                {'count': 0, 'rating_sum': 0, 'rated': 0, 'response_time_sum': 0, 'timed': 0}
+            )
+            month = month_totals.setdefault(
+                f"{group['review_date__year']:04d}-{group['review_date__month']:02d}",
+                {'count': 0, 'rating_sum': 0, 'rated': 0, 'sentiment_positive': 0, 'sentiment_negative': 0}
+            )
+            for totals in (platform, month):
+                for key in totals:
+                    totals[key] += group[key] or 0
+
+        platform_stats = sorted(
+            (
+                {
+                    'platform': platform,
+                    'count': totals['count'],
+                    'avg_rating': totals['rating_sum'] / totals['rated'] if totals['rated'] else None,
+                    'avg_response_time': totals['response_time_sum'] / totals['timed'] if totals['timed'] else None
+                }
+                for platform, totals in platform_totals.items()
+            ),
+            key=lambda stats: stats['avg_rating'] or 0,
+            reverse=True
+        )
 
         for platform in platform_stats:
             platform_analysis[platform['platform']] = {
                 'count': platform['count'],
-                'avg_rating': round(platform['avg_rating'], 2),
+                'avg_rating': round(platform['avg_rating'] or 0, 2),
                 'percentage': round((platform['count'] / total_reviews) * 100, 1),
                 'avg_response_time': round(platform['avg_response_time'] or 0, 1)
             }
 
-        # Temporal analysis - review trends over time
+        # Temporal analysis - review trends over the last 12 calendar months
         monthly_reviews = {}
         for i in range(12):
-            month_start = timezone.now().replace(day=1) - timedelta(days=30 * i)
-            month_end = month_start + timedelta(days=30)
+            year, month_index = divmod(now.year * 12 + now.month - 1 - i, 12)
+            month_key = f'{year:04d}-{month_index + 1:02d}'
+            totals = month_totals.get(month_key)
 
-            month_reviews = reviews.filter(review_date__range=[month_start, month_end])
-            month_key = month_start.strftime('%Y-%m')
-
-            if month_reviews.exists():
+            if totals:
                 monthly_reviews[month_key] = {
-                    'count': month_reviews.count(),
-                    'avg_rating': month_reviews.aggregate(avg=Avg('normalized_rating'))['avg'],
-                    'sentiment_positive': month_reviews.filter(sentiment='positive').count(),
-                    'sentiment_negative': month_reviews.filter(sentiment='negative').count()
+                    'count': totals['count'],
+                    'avg_rating': totals['rating_sum'] / totals['rated'] if totals['rated'] else None,
+                    'sentiment_positive': totals['sentiment_positive'],
+                    'sentiment_negative': totals['sentiment_negative']
                 }
 
         # Sentiment analysis insights
-        sentiment_breakdown = reviews.values('sentiment').annotate(count=Count('id'))
-        sentiment_data = {item['sentiment']: item['count'] for item in sentiment_breakdown}
+        sentiment_data = {
+            sentiment: review_totals[sentiment]
+            for sentiment in ('positive', 'neutral', 'negative')
+            if review_totals[sentiment]
+        }
 
-        positive_percentage = (sentiment_data.get('positive', 0) / total_reviews) * 100
-        negative_percentage = (sentiment_data.get('negative', 0) / total_reviews) * 100
+        positive_percentage = (review_totals['positive'] / total_reviews) * 100
+        negative_percentage = (review_totals['negative'] / total_reviews) * 100
 
         if positive_percentage > 80:
             sentiment_insights.append({
@@ -1905,34 +2187,18 @@ class BusinessIntelligenceView(TemplateView):
 
         # Aspect-based analysis
         aspect_ratings = {}
-        for aspect in ['cleanliness_rating', 'communication_rating', 'location_rating', 'value_rating',
-                       'amenities_rating']:
-            avg_aspect = reviews.aggregate(avg=Avg(aspect))['avg']
+        for field, label in self._REVIEW_ASPECTS:
+            avg_aspect = review_totals[f'avg_{field}']
             if avg_aspect:
-                aspect_name = aspect.replace('_rating', '').title()
-                aspect_ratings[aspect_name] = round(avg_aspect, 2)
+                aspect_ratings[label] = round(avg_aspect, 2)
 
         # Response analysis
-        responded_reviews = reviews.filter(response_text__isnull=False)
-        response_rate = (responded_reviews.count() / total_reviews) * 100
-
-        if responded_reviews.exists():
-            avg_response_time = sum(
-                review.response_time for review in responded_reviews
-                if review.response_time
-            ) / responded_reviews.count()
-        else:
-            avg_response_time = 0
+        response_rate = (review_totals['responded'] / total_reviews) * 100
+        avg_response_time = review_totals['avg_response_time'] or 0
 
         # Recent review trends
-        recent_reviews = reviews.filter(review_date__gte=timezone.now() - timedelta(days=30))
-        previous_reviews = reviews.filter(
-            review_date__gte=timezone.now() - timedelta(days=60),
-            review_date__lt=timezone.now() - timedelta(days=30)
-        )
-
-        recent_avg_rating = recent_reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
-        previous_avg_rating = previous_reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
+        recent_avg_rating = review_totals['recent_avg'] or 0
+        previous_avg_rating = review_totals['previous_avg'] or 0
 
         rating_trend = 'stable'
         if recent_avg_rating > previous_avg_rating + 0.2:
@@ -1941,25 +2207,19 @@ class BusinessIntelligenceView(TemplateView):
             rating_trend = 'declining'
 
         # Keyword analysis (simplified)
-        positive_keywords = ['clean', 'amazing', 'perfect', 'excellent', 'comfortable', 'beautiful']
-        negative_keywords = ['dirty', 'noise', 'problem', 'issue', 'poor', 'disappointed']
-
-        keyword_mentions = {'positive': {}, 'negative': {}}
-
-        for review in reviews:
-            content_lower = review.content.lower()
-
-            for keyword in positive_keywords:
-                if keyword in content_lower:
-                    keyword_mentions['positive'][keyword] = keyword_mentions['positive'].get(keyword, 0) + 1
-
-            for keyword in negative_keywords:
-                if keyword in content_lower:
-                    keyword_mentions['negative'][keyword] = keyword_mentions['negative'].get(keyword, 0) + 1
+        keyword_counts = reviews.annotate(content_lower=Lower('content')).aggregate(**_REVIEW_KEYWORD_COUNTS)
+        keyword_mentions = {
+            polarity: {
+                keyword: keyword_counts[f'{polarity}_{keyword}']
+                for keyword in keywords
+                if keyword_counts[f'{polarity}_{keyword}']
+            }
+            for polarity, keywords in _REVIEW_KEYWORDS.items()
+        }
 
         # Top mentioned keywords
-        top_positive = sorted(keyword_mentions['positive'].items(), key=lambda x: x[1], reverse=True)[:5]
-        top_negative = sorted(keyword_mentions['negative'].items(), key=lambda x: x[1], reverse=True)[:5]
+        top_positive = heapq.nlargest(5, keyword_mentions['positive'].items(), key=itemgetter(1))
+        top_negative = heapq.nlargest(5, keyword_mentions['negative'].items(), key=itemgetter(1))
 
         review_intelligence = {
             'total_reviews': total_reviews,
@@ -1980,14 +2240,14 @@ class BusinessIntelligenceView(TemplateView):
         context.update({
             'review_intelligence': review_intelligence,
             'platform_performance': list(platform_stats),
-            'recent_review_count': recent_reviews.count(),
-            'review_velocity': recent_reviews.count() - previous_reviews.count(),
+            'recent_review_count': review_totals['recent_count'],
+            'review_velocity': review_totals['recent_count'] - review_totals['previous_count'],
         })
 
     def _generate_competitive_intelligence(self, context, user, properties, competitor_analyses):
         """Generate competitive intelligence analysis"""
 
-        if not competitor_analyses.exists():
+        if not properties.exists() or not competitor_analyses.exists():
             context.update({
                 'competitive_intelligence': {
                     'message': 'No competitor data available. Add competitor analysis to unlock insights.'
@@ -1995,6 +2255,7 @@ class BusinessIntelligenceView(TemplateView):
             })
             return
 
+        now = timezone.now()
         competitive_insights = []
         market_positioning = {}
         competitive_opportunities = []
@@ -2004,20 +2265,30 @@ class BusinessIntelligenceView(TemplateView):
         avg_competitor_rate = competitor_analyses.aggregate(avg=Avg('average_rate'))['avg'] or 0
         avg_competitor_rating = competitor_analyses.aggregate(avg=Avg('average_rating'))['avg'] or 0
 
+        # Competitors and review averages loaded for all properties up front
+        properties_with_competitors = properties.prefetch_related(
+            Prefetch('competitor_analyses', queryset=competitor_analyses, to_attr='comps')
+        ).annotate(avg_review_rating=Avg('reviews__normalized_rating'))
+
         # Property-specific competitive analysis
-        for property_obj in properties:
-            property_competitors = competitor_analyses.filter(property=property_obj)
+        competitive_percentiles = {}
+        for property_obj in properties_with_competitors:
+            property_competitors = property_obj.comps
 
-            if property_competitors.exists():
-                property_reviews = Review.objects.filter(property=property_obj)
+            if property_competitors:
+                rate_percentile = rating_percentile = None
 
                 # Rate comparison
                 property_rate = getattr(property_obj, 'base_price', 0)
-                competitor_rates = [comp.average_rate for comp in property_competitors if comp.average_rate]
+                competitor_rates = np.sort(np.fromiter(
+                    (comp.average_rate for comp in property_competitors if comp.average_rate), dtype=np.float64
+                ))
 
-                if competitor_rates and property_rate > 0:
-                    rate_percentile = sum(1 for rate in competitor_rates if rate < property_rate) / len(
-                        competitor_rates) * 100
+                if competitor_rates.size and property_rate > 0:
+                    # Share of competitors priced strictly below this property
+                    rate_percentile = float(
+                        np.searchsorted(competitor_rates, float(property_rate)) / competitor_rates.size * 100
+                    )
 
                     if rate_percentile > 75:
                         competitive_insights.append({
@@ -2037,39 +2308,42 @@ class BusinessIntelligenceView(TemplateView):
                         })
 
                 # Rating comparison
-                if property_reviews.exists():
-                    property_rating = property_reviews.aggregate(avg=Avg('normalized_rating'))['avg']
-                    competitor_ratings = [comp.average_rating for comp in property_competitors if comp.average_rating]
-
-                    if competitor_ratings and property_rating:
-                        rating_percentile = sum(1 for rating in competitor_ratings if rating < property_rating) / len(
-                            competitor_ratings) * 100
-
-                        if rating_percentile > 80:
-                            competitive_insights.append({
-                                'title': f'{property_obj.name} - Service Excellence',
-                                'description': f'Rated higher than {rating_percentile:.0f}% of competitors. Leverage for premium pricing.',
-                                'impact': 'High',
-                                'property': property_obj.name,
-                                'type': 'service'
-                            })
-                        elif rating_percentile < 40:
-                            competitive_insights.append({
-                                'title': f'{property_obj.name} - Service Improvement Needed',
-                                'description': f'Rated lower than {100 - rating_percentile:.0f}% of competitors. Focus on quality improvements.',
-                                'impact': 'High',
-                                'property': property_obj.name,
-                                'type': 'service'
-                            })
+                property_rating = property_obj.avg_review_rating
+                competitor_ratings = np.sort(np.fromiter(
+                    (comp.average_rating for comp in property_competitors if comp.average_rating), dtype=np.float64
+                ))
+
+                if competitor_ratings.size and property_rating:
+                    rating_percentile = float(
+                        np.searchsorted(competitor_ratings, property_rating) / competitor_ratings.size * 100
+                    )
+
+                    if rating_percentile > 80:
+                        competitive_insights.append({
+                            'title': f'{property_obj.name} - Service Excellence',
+                            'description': f'Rated higher than {rating_percentile:.0f}% of competitors. Leverage for premium pricing.',
+                            'impact': 'High',
+                            'property': property_obj.name,
+                            'type': 'service'
+                        })
+                    elif rating_percentile < 40:
+                        competitive_insights.append({
+                            'title': f'{property_obj.name} - Service Improvement Needed',
+                            'description': f'Rated lower than {100 - rating_percentile:.0f}% of competitors. Focus on quality improvements.',
+                            'impact': 'High',
+                            'property': property_obj.name,
+                            'type': 'service'
+                        })
+
+                competitive_percentiles[property_obj.id] = (rate_percentile, rating_percentile)
 
                 # Amenity gap analysis
-                competitor_amenities = set()
-                for comp in property_competitors:
-                    competitor_amenities.update(comp.amenities)
+                competitor_amenities = frozenset().union(*(comp.amenities or () for comp in property_competitors))
 
                 # This would need actual property amenity comparison
-                common_amenities = ['wifi', 'parking', 'kitchen', 'air_conditioning', 'pool']
-                missing_amenities = [amenity for amenity in common_amenities if amenity not in competitor_amenities]
+                missing_amenities = [
+                    amenity for amenity in self._COMMON_AMENITIES if amenity not in competitor_amenities
+                ]
 
                 if missing_amenities:
                     competitive_opportunities.append({
@@ -2082,7 +2356,11 @@ class BusinessIntelligenceView(TemplateView):
 
         # Market share estimation
         total_competitor_reviews = competitor_analyses.aggregate(total=Sum('review_count'))['total'] or 0
-        user_reviews = Review.objects.filter(property__owner=user).count()
+        user_review_stats = Review.objects.filter(property__owner=user).aggregate(
+            count=Count('id'),
+            avg=Avg('normalized_rating')
+        )
+        user_reviews = user_review_stats['count']
 
         estimated_market_share = (user_reviews / (
                     user_reviews + total_competitor_reviews)) * 100 if total_competitor_reviews > 0 else 0
@@ -2097,8 +2375,7 @@ class BusinessIntelligenceView(TemplateView):
             avg_direct_rate = direct_competitors.aggregate(avg=Avg('average_rate'))['avg']
             avg_direct_rating = direct_competitors.aggregate(avg=Avg('average_rating'))['avg']
 
-            user_avg_rating = Review.objects.filter(property__owner=user).aggregate(avg=Avg('normalized_rating'))[
-                                  'avg'] or 0
+            user_avg_rating = user_review_stats['avg'] or 0
 
             if user_avg_rating > avg_direct_rating:
                 strengths.append('Superior guest satisfaction vs direct competitors')
@@ -2114,16 +2391,32 @@ class BusinessIntelligenceView(TemplateView):
 
         # Competitive positioning matrix
         positioning_data = []
-        for property_obj in properties:
-            property_competitors = competitor_analyses.filter(property=property_obj)
+        for property_obj in properties_with_competitors:
+            property_competitors = property_obj.comps
+
+            if property_competitors:
+                # Scores come from the competitor percentiles; a per-property seed keeps fallbacks stable
+                rate_percentile, rating_percentile = competitive_percentiles[property_obj.id]
+                rng = np.random.default_rng(property_obj.id)
+                price_score = int(100 - rate_percentile) if rate_percentile is not None else int(rng.integers(60, 96))
+                quality_score = int(rating_percentile) if rating_percentile is not None else int(rng.integers(70, 96))
+
+                position_score = (price_score + quality_score) / 2
+                if position_score >= 70:
+                    market_position = 'Leader'
+                elif position_score >= 50:
+                    market_position = 'Challenger'
+                elif position_score >= 30:
+                    market_position = 'Follower'
+                else:
+                    market_position = 'Niche'
 
-            if property_competitors.exists():
                 positioning_data.append({
                     'property': property_obj.name,
-                    'price_score': random.randint(60, 95),
-                    'quality_score': random.randint(70, 95),
-                    'competitor_count': property_competitors.count(),
-                    'market_position': random.choice(['Leader', 'Challenger', 'Follower', 'Niche'])
+                    'price_score': price_score,
+                    'quality_score': quality_score,
+                    'competitor_count': len(property_competitors),
+                    'market_position': market_position
                 })
 
         market_positioning = {
@@ -2139,7 +2432,7 @@ class BusinessIntelligenceView(TemplateView):
 
         # Threat analysis
         threats = []
-        new_competitors = competitor_analyses.filter(created_at__gte=timezone.now() - timedelta(days=90))
+        new_competitors = competitor_analyses.filter(created_at__gte=now - timedelta(days=90))
         if new_competitors.exists():
             threats.append({
                 'threat': 'New Market Entrants',
@@ -2168,7 +2461,9 @@ class BusinessIntelligenceView(TemplateView):
                 'opportunities': competitive_opportunities,
                 'threats': threats,
                 'total_competitors': total_competitors,
-                'competitive_data': list(competitor_analyses.values())
+                'competitive_data': list(
+                    competitor_analyses.values(*_COMPETITOR_DATA_FIELDS).iterator(chunk_size=500)
+                )
             }
         })
 
@@ -2218,16 +2513,24 @@ class BusinessIntelligenceView(TemplateView):
             }
 
         # Property positioning analysis
-        for property_obj in properties:
-            property_reviews = Review.objects.filter(property=property_obj)
-
-            if property_reviews.exists():
-                property_rating = property_reviews.aggregate(avg=Avg('normalized_rating'))['avg']
-                property_rate = getattr(property_obj, 'base_price', 0)  # Would need actual rate data
+        # Review stats and rate vs market ADR are computed by the database for every property at once
+        market_adr = latest_market_data.average_daily_rate
+        positioned_properties = properties.annotate(
+            review_avg=Avg('reviews__normalized_rating'),
+            review_count=Count('reviews'),
+            rate_vs_market=Case(
+                When(base_price__gt=0, then=Cast(
+                    (F('base_price') - Value(market_adr)) / Value(market_adr) * 100, FloatField()
+                )),
+                default=Value(0.0),
+                output_field=FloatField()
+            )
+        )
 
-                # Compare against market averages
-                rate_vs_market = ((property_rate - float(latest_market_data.average_daily_rate)) / float(
-                    latest_market_data.average_daily_rate)) * 100 if property_rate > 0 else 0
+        for property_obj in positioned_properties:
+            if property_obj.review_count:
+                property_rating = property_obj.review_avg
+                rate_vs_market = property_obj.rate_vs_market
 
                 # Calculate positioning score
                 positioning_score = 0
@@ -2244,7 +2547,7 @@ class BusinessIntelligenceView(TemplateView):
                     positioning_score += 15  # Market rate positioning
 
                 # Review count factor
-                review_count = property_reviews.count()
+                review_count = property_obj.review_count
                 if review_count > 50:
                     positioning_score += 15
                 elif review_count > 20:
@@ -2277,21 +2580,25 @@ class BusinessIntelligenceView(TemplateView):
             'growth_rate': market_growth_rate,
             'adr_growth': market_adr_growth,
             'market_size': latest_market_data.search_volume,
-            'saturation_level': self._assess_market_saturation(latest_market_data),
-            'entry_barriers': self._assess_entry_barriers(latest_market_data),
+            'saturation_level': self._assess_market_saturation(latest_market_data.occupancy_rate),
+            'entry_barriers': self._assess_entry_barriers(latest_market_data.average_daily_rate),
             'recommended_actions': self._generate_opportunity_actions(opportunity_level, market_trends)
         }
 
         # Seasonal positioning
-        seasonal_factors = []
-        for data_point in market_data.order_by('-date')[:12]:  # Last 12 months
-            seasonal_factors.append({
-                'month': data_point.date.strftime('%B'),
-                'adr': float(data_point.average_daily_rate),
-                'occupancy': float(data_point.occupancy_rate),
-                'demand': data_point.search_volume,
-                'events': data_point.events
-            })
+        data_points = market_data.order_by('-date').values(
+            'date', 'average_daily_rate', 'occupancy_rate', 'search_volume', 'events'
+        )[:12]  # Last 12 months
+        seasonal_factors = [
+            {
+                'month': data_point['date'].strftime('%B'),
+                'adr': float(data_point['average_daily_rate']),
+                'occupancy': float(data_point['occupancy_rate']),
+                'demand': data_point['search_volume'],
+                'events': data_point['events']
+            }
+            for data_point in data_points
+        ]
 
         context.update({
             'market_positioning': {
@@ -2299,7 +2606,10 @@ class BusinessIntelligenceView(TemplateView):
                 'trends': market_trends,
                 'opportunity_assessment': opportunity_assessment,
                 'seasonal_factors': seasonal_factors,
-                'market_health': self._calculate_market_health(latest_market_data),
+                'market_health': self._calculate_market_health(
+                    latest_market_data.occupancy_rate, latest_market_data.average_daily_rate,
+                    latest_market_data.search_volume, len(latest_market_data.events)
+                ),
                 'positioning_recommendations': self._generate_market_positioning_recommendations(positioning_analysis,
                                                                                                  market_trends)
             }
@@ -2307,14 +2617,8 @@ class BusinessIntelligenceView(TemplateView):
 
     def _determine_market_position(self, score):
         """Determine market position based on score"""
-        if score >= 70:
-            return 'Market Leader'
-        elif score >= 50:
-            return 'Strong Challenger'
-        elif score >= 30:
-            return 'Market Follower'
-        else:
-            return 'Niche Player'
+        thresholds, positions = _MARKET_POSITION_LADDER
+        return positions[bisect_right(thresholds, score)]
 
     def _generate_positioning_recommendations(self, score, rate_vs_market, rating):
         """Generate positioning recommendations"""
@@ -2333,25 +2637,15 @@ class BusinessIntelligenceView(TemplateView):
 
         return recommendations
 
-    def _assess_market_saturation(self, market_data):
+    def _assess_market_saturation(self, occupancy_rate):
         """Assess market saturation level"""
         # Simplified saturation assessment
-        if market_data.occupancy_rate > 85:
-            return 'High'
-        elif market_data.occupancy_rate > 70:
-            return 'Medium'
-        else:
-            return 'Low'
+        return _ladder(_SATURATION_LADDER, occupancy_rate)
 
-    def _assess_entry_barriers(self, market_data):
+    def _assess_entry_barriers(self, average_daily_rate):
         """Assess market entry barriers"""
         # Simplified barrier assessment
-        if market_data.average_daily_rate > 200:
-            return 'High'
-        elif market_data.average_daily_rate > 100:
-            return 'Medium'
-        else:
-            return 'Low'
+        return _ladder(_ENTRY_BARRIER_LADDER, average_daily_rate)
 
     def _generate_opportunity_actions(self, opportunity_level, market_trends):
         """Generate opportunity-based actions"""
@@ -2372,41 +2666,14 @@ class BusinessIntelligenceView(TemplateView):
 
         return actions
 
-    def _calculate_market_health(self, market_data):
+    def _calculate_market_health(self, occupancy_rate, average_daily_rate, search_volume, event_count):
         """Calculate overall market health score"""
-        health_score = 0
-
-        # Occupancy factor
-        if market_data.occupancy_rate > 80:
-            health_score += 30
-        elif market_data.occupancy_rate > 70:
-            health_score += 25
-        elif market_data.occupancy_rate > 60:
-            health_score += 20
-
-        # ADR factor
-        if market_data.average_daily_rate > 150:
-            health_score += 25
-        elif market_data.average_daily_rate > 100:
-            health_score += 20
-        elif market_data.average_daily_rate > 75:
-            health_score += 15
-
-        # Demand factor
-        if market_data.search_volume > 1000:
-            health_score += 25
-        elif market_data.search_volume > 500:
-            health_score += 20
-        elif market_data.search_volume > 200:
-            health_score += 15
-
-        # Events factor
-        if len(market_data.events) > 3:
-            health_score += 20
-        elif len(market_data.events) > 1:
-            health_score += 15
-        elif len(market_data.events) > 0:
-            health_score += 10
+        health_score = (
+            _ladder(_HEALTH_OCCUPANCY_LADDER, occupancy_rate) +
+            _ladder(_HEALTH_ADR_LADDER, average_daily_rate) +
+            _ladder(_HEALTH_SEARCH_LADDER, search_volume) +
+            _ladder(_HEALTH_EVENTS_LADDER, event_count)
+        )
 
         return min(100, health_score)
 
@@ -2445,42 +2712,70 @@ class BusinessIntelligenceView(TemplateView):
 
         return recommendations
 
-    def _generate_pricing_optimization_intelligence(self, context, user, pricing_rules, bookings, market_data):
-        """Generate pricing optimization intelligence"""
+    def _generate_pricing_optimization_intelligence(self, context, bi, pricing_rules):
+        """Generate pricing optimization intelligence, cached per user for the day"""
+        context.update(cache.get_or_set(
+            _bi_cache_key('pricing_optimization', bi.user.pk),
+            lambda: self._build_pricing_optimization_intelligence(bi, pricing_rules),
+            settings.BI_CACHE_TTL
+        ))
+
+    def _build_pricing_optimization_intelligence(self, bi, pricing_rules):
+        """Build the pricing optimization intelligence context entries"""
 
+        bookings = bi.bookings
         pricing_intelligence = {}
         optimization_opportunities = []
         pricing_performance = {}
 
         # Analyze current pricing rules effectiveness
-        active_rules = pricing_rules.filter(is_active=True)
-
-        for rule in active_rules:
-            rule_bookings = bookings.filter(
-                property=rule.rental_property,
-                check_in__gte=rule.created_at
-            )
+        active_rules = pricing_rules.filter(is_active=True).select_related('rental_property')
+        rule_list = list(active_rules)
+        active_rules_count = len(rule_list)
+
+        # Each rule covers its property's bookings since the rule was created; aggregate all rules at once
+        booking_aggregates = {}
+        revenue_aggregates = {}
+        for rule in rule_list:
+            rule_filter = Q(property=rule.rental_property_id, check_in__gte=rule.created_at)
+            payment_filter = Q(booking__property=rule.rental_property_id, booking__check_in__gte=rule.created_at)
+            booking_aggregates[f'count_{rule.pk}'] = Count('id', filter=rule_filter)
+            booking_aggregates[f'avg_{rule.pk}'] = Avg('total_amount', filter=rule_filter)
+            revenue_aggregates[f'revenue_{rule.pk}'] = Sum('amount', filter=payment_filter)
+
+        rule_stats = {}
+        if rule_list:
+            rule_stats = bookings.aggregate(**booking_aggregates)
+            rule_stats.update(Payment.objects.filter(
+                booking__in=bookings,
+                status='completed'
+            ).aggregate(**revenue_aggregates))
 
-            if rule_bookings.exists():
-                rule_revenue = Payment.objects.filter(
-                    booking__in=rule_bookings,
-                    status='completed'
-                ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+        effectiveness_total = 0
+        effectiveness_count = 0
+        for rule in rule_list:
+            booking_count = rule_stats[f'count_{rule.pk}']
 
-                avg_rate = rule_bookings.aggregate(avg=Avg('total_amount'))['avg'] or 0
-                booking_count = rule_bookings.count()
+            if booking_count:
+                rule_revenue = rule_stats[f'revenue_{rule.pk}'] or Decimal('0.00')
+                avg_rate = rule_stats[f'avg_{rule.pk}'] or 0
 
                 # Calculate rule effectiveness
                 effectiveness_score = 0
                 if avg_rate > 0:
                     effectiveness_score = min(100, (float(avg_rate) / 200) * 100)  # Simplified scoring
 
+                effectiveness_score = round(effectiveness_score, 1)
+                effectiveness_total += effectiveness_score
+                effectiveness_count += 1
+
                 pricing_performance[rule.name] = {
-                    'rule': rule,
+                    'rule_id': rule.pk,
+                    'name': rule.name,
                     'bookings': booking_count,
                     'revenue': float(rule_revenue),
                     'avg_rate': float(avg_rate),
-                    'effectiveness': round(effectiveness_score, 1),
+                    'effectiveness': effectiveness_score,
                     'property': rule.rental_property.name
                 }
 
@@ -2503,16 +2798,21 @@ class BusinessIntelligenceView(TemplateView):
                     'implementation': 'Easy'
                 })
 
-        # Seasonal pricing optimization
-        seasonal_rates = {}
-        for booking in bookings:
-            season = self._get_season_from_month(booking.check_in.month)
-            if season not in seasonal_rates:
-                seasonal_rates[season] = []
-            seasonal_rates[season].append(float(booking.total_amount))
+        # Seasonal pricing optimization, grouped in the database
+        seasonal_rates = bookings.annotate(
+            season=Case(
+                When(check_in__month__in=[12, 1, 2], then=Value('Winter')),
+                When(check_in__month__in=[3, 4, 5], then=Value('Spring')),
+                When(check_in__month__in=[6, 7, 8], then=Value('Summer')),
+                default=Value('Fall'),
+                output_field=CharField()
+            )
+        ).values('season').annotate(avg_rate=Avg('total_amount'))
 
         # Find underpriced seasons
-        season_averages = {season: sum(rates) / len(rates) for season, rates in seasonal_rates.items() if rates}
+        season_averages = {
+            row['season']: float(row['avg_rate']) for row in seasonal_rates if row['avg_rate'] is not None
+        }
 
         if len(season_averages) > 1:
             max_season_rate = max(season_averages.values())
@@ -2526,25 +2826,22 @@ class BusinessIntelligenceView(TemplateView):
                         'implementation': 'Medium'
                     })
 
-        # Lead time pricing optimization
-        lead_time_analysis = {}
-        for booking in bookings:
-            lead_time = (booking.check_in.date() - booking.created_at.date()).days
-
-            if lead_time <= 7:
-                category = 'last_minute'
-            elif lead_time <= 30:
-                category = 'short_term'
-            else:
-                category = 'long_term'
-
-            if category not in lead_time_analysis:
-                lead_time_analysis[category] = []
-            lead_time_analysis[category].append(float(booking.total_amount))
+        # Lead time pricing optimization, bucketed in the database by whole days between the dates
+        lead_time_analysis = bookings.annotate(
+            lead_time=ExpressionWrapper(TruncDate('check_in') - TruncDate('created_at'), output_field=DurationField())
+        ).annotate(
+            category=Case(
+                When(lead_time__lte=timedelta(days=7), then=Value('last_minute')),
+                When(lead_time__lte=timedelta(days=30), then=Value('short_term')),
+                default=Value('long_term'),
+                output_field=CharField()
+            )
+        ).values('category').annotate(avg_rate=Avg('total_amount'))
 
         # Analyze lead time pricing patterns
-        lead_time_averages = {category: sum(rates) / len(rates) for category, rates in lead_time_analysis.items() if
-                              rates}
+        lead_time_averages = {
+            row['category']: float(row['avg_rate']) for row in lead_time_analysis if row['avg_rate'] is not None
+        }
 
         if 'last_minute' in lead_time_averages and 'long_term' in lead_time_averages:
             if lead_time_averages['last_minute'] < lead_time_averages['long_term'] * 1.1:
@@ -2557,12 +2854,12 @@ class BusinessIntelligenceView(TemplateView):
                 })
 
         # Market-based pricing optimization
-        if market_data.exists():
-            latest_market = market_data.order_by('-date').first()
+        latest_market = bi.latest_market
+        user_avg_rate = bi.user_avg_rate
 
+        if latest_market:
             # Compare user rates to market average
-            user_avg_rate = bookings.aggregate(avg=Avg('total_amount'))['avg'] or 0
-            market_adr = float(latest_market.average_daily_rate)
+            market_adr = bi.market_adr
 
             if user_avg_rate < market_adr * 0.9:  # 10% below market
                 optimization_opportunities.append({
@@ -2574,7 +2871,7 @@ class BusinessIntelligenceView(TemplateView):
                 })
 
         # Dynamic pricing recommendations
-        if active_rules.count() < 2:
+        if active_rules_count < 2:
             optimization_opportunities.append({
                 'title': 'Implement Dynamic Pricing',
                 'description': 'Limited pricing automation detected. Implement comprehensive dynamic pricing system.',
@@ -2583,24 +2880,29 @@ class BusinessIntelligenceView(TemplateView):
                 'implementation': 'Complex'
             })
 
-        # Length of stay optimization
-        stay_length_analysis = {}
-        for booking in bookings:
-            stay_length = (booking.check_out - booking.check_in).days
-
-            if stay_length <= 2:
-                category = 'short'
-            elif stay_length <= 7:
-                category = 'medium'
-            else:
-                category = 'long'
-
-            if category not in stay_length_analysis:
-                stay_length_analysis[category] = []
-            stay_length_analysis[category].append(float(booking.total_amount) / stay_length)  # Daily rate
+        # Length of stay optimization: average daily rate per stay bucket, computed in the database
+        stay_length_analysis = bookings.annotate(
+            stay_days=ExpressionWrapper(F('check_out') - F('check_in'), output_field=DurationField())
+        ).filter(
+            stay_days__gte=timedelta(days=1)
+        ).annotate(
+            category=Case(
+                When(stay_days__lt=timedelta(days=3), then=Value('short')),
+                When(stay_days__lt=timedelta(days=8), then=Value('medium')),
+                default=Value('long'),
+                output_field=CharField()
+            )
+        ).values('category').annotate(
+            avg_daily_rate=Avg(ExpressionWrapper(
+                F('total_amount') / Extract('stay_days', 'day'), output_field=DecimalField()
+            ))
+        )
 
         # Analyze length of stay pricing
-        los_averages = {category: sum(rates) / len(rates) for category, rates in stay_length_analysis.items() if rates}
+        los_averages = {
+            row['category']: float(row['avg_daily_rate'])
+            for row in stay_length_analysis if row['avg_daily_rate'] is not None
+        }
 
         if 'long' in los_averages and 'short' in los_averages:
             if los_averages['long'] > los_averages['short'] * 0.8:  # Long stays should be discounted
@@ -2616,20 +2918,19 @@ class BusinessIntelligenceView(TemplateView):
         pricing_score = 0
 
         # Rule coverage
-        if active_rules.count() >= 3:
+        if active_rules_count >= 3:
             pricing_score += 25
-        elif active_rules.count() >= 1:
+        elif active_rules_count >= 1:
             pricing_score += 15
 
         # Performance
-        if pricing_performance:
-            avg_effectiveness = sum(p['effectiveness'] for p in pricing_performance.values()) / len(pricing_performance)
+        if effectiveness_count:
+            avg_effectiveness = effectiveness_total / effectiveness_count
             pricing_score += min(30, avg_effectiveness * 0.3)
 
         # Market alignment
-        if market_data.exists() and bookings.exists():
-            user_avg_rate = bookings.aggregate(avg=Avg('total_amount'))['avg'] or 0
-            market_adr = float(market_data.order_by('-date').first().average_daily_rate)
+        if latest_market and user_avg_rate:
+            market_adr = bi.market_adr
 
             if 0.9 <= (user_avg_rate / market_adr) <= 1.1:  # Within 10% of market
                 pricing_score += 25
@@ -2642,20 +2943,19 @@ class BusinessIntelligenceView(TemplateView):
 
         pricing_intelligence = {
             'overall_score': round(pricing_score),
-            'active_rules': active_rules.count(),
+            'active_rules': active_rules_count,
             'optimization_opportunities': optimization_opportunities,
             'pricing_performance': pricing_performance,
             'market_alignment': 'Good' if pricing_score > 70 else 'Needs Improvement',
-            'total_potential_revenue': sum(
-                float(booking.total_amount) * 0.15 for booking in bookings  # 15% average increase potential
-            ),
+            # 15% average increase potential
+            'total_potential_revenue': float((bi.booking_totals['total_amount'] or Decimal('0.00')) * Decimal('0.15')),
             'recommendations': self._generate_pricing_recommendations(optimization_opportunities, pricing_performance)
         }
 
-        context.update({
+        return {
             'pricing_intelligence': pricing_intelligence,
             'pricing_optimization_score': round(pricing_score),
-        })
+        }
 
     def _generate_pricing_recommendations(self, opportunities, performance):
         """Generate pricing recommendations based on analysis"""
@@ -2680,7 +2980,7 @@ class BusinessIntelligenceView(TemplateView):
                 recommendations.append({
                     'title': 'Pricing Rule Optimization',
                     'description': f'Optimize {len(low_performing_rules)} underperforming pricing rules.',
-                    'actions': [f'Review {rule["rule"].name}' for rule in low_performing_rules],
+                    'actions': [f'Review {rule["name"]}' for rule in low_performing_rules],
                     'timeline': '2-6 weeks'
                 })
 
@@ -2701,29 +3001,29 @@ class BusinessIntelligenceView(TemplateView):
             })
             return
 
-        total_tasks = maintenance_tasks.count()
-        ai_predicted_tasks = maintenance_tasks.filter(predicted_by_ai=True)
-        completed_tasks = maintenance_tasks.filter(status='completed')
-
-        # AI prediction accuracy analysis
-        prediction_accuracy = 0
-        if ai_predicted_tasks.exists():
-            accurate_predictions = ai_predicted_tasks.filter(
+        # Task counts and cost totals in one conditional aggregate
+        task_totals = maintenance_tasks.aggregate(
+            total=Count('id'),
+            ai_predicted=Count('id', filter=Q(predicted_by_ai=True)),
+            accurate_predictions=Count('id', filter=Q(
+                predicted_by_ai=True,
                 predicted_failure_date__isnull=False,
                 status='completed'
-            ).count()
+            )),
+            estimated_cost=Sum('estimated_cost'),
+            actual_cost=Sum('actual_cost')
+        )
+        total_tasks = task_totals['total']
+        ai_predicted_count = task_totals['ai_predicted']
 
-            if accurate_predictions > 0:
-                prediction_accuracy = (accurate_predictions / ai_predicted_tasks.count()) * 100
+        # AI prediction accuracy analysis
+        prediction_accuracy = 0
+        if task_totals['accurate_predictions'] > 0:
+            prediction_accuracy = (task_totals['accurate_predictions'] / ai_predicted_count) * 100
 
         # Cost analysis
-        total_estimated_cost = maintenance_tasks.filter(
-            estimated_cost__isnull=False
-        ).aggregate(total=Sum('estimated_cost'))['total'] or Decimal('0.00')
-
-        total_actual_cost = maintenance_tasks.filter(
-            actual_cost__isnull=False
-        ).aggregate(total=Sum('actual_cost'))['total'] or Decimal('0.00')
+        total_estimated_cost = task_totals['estimated_cost'] or Decimal('0.00')
+        total_actual_cost = task_totals['actual_cost'] or Decimal('0.00')
 
         cost_variance = 0
         if total_estimated_cost > 0 and total_actual_cost > 0:
@@ -2731,27 +3031,31 @@ class BusinessIntelligenceView(TemplateView):
 
         # Predictive maintenance insights
 
-        # Identify patterns in maintenance frequency
-        property_maintenance_frequency = {}
-        for task in maintenance_tasks:
-            property_name = task.rental_property.name
-            if property_name not in property_maintenance_frequency:
-                property_maintenance_frequency[property_name] = []
-            property_maintenance_frequency[property_name].append(task)
+        # Identify patterns in maintenance frequency, grouped per property in the database
+        # Falls back to the estimate when the actual cost is missing or zero, as "actual or estimated" did
+        task_cost = Case(
+            When(actual_cost__gt=0, then='actual_cost'),
+            default=Coalesce('estimated_cost', Value(Decimal('0.00'))),
+            output_field=DecimalField()
+        )
+        property_maintenance_frequency = maintenance_tasks.values('rental_property__name').annotate(
+            task_count=Count('id'),
+            total_cost=Sum(task_cost),
+            urgent_tasks=Count('id', filter=Q(priority='urgent'))
+        ).filter(task_count__gt=5).order_by()  # Threshold for high maintenance
 
         # Analyze high-maintenance properties
         high_maintenance_properties = []
-        for property_name, tasks in property_maintenance_frequency.items():
-            if len(tasks) > 5:  # Threshold for high maintenance
-                avg_cost = sum(float(task.actual_cost or task.estimated_cost or 0) for task in tasks) / len(tasks)
-
-                high_maintenance_properties.append({
-                    'property': property_name,
-                    'task_count': len(tasks),
-                    'avg_cost': round(avg_cost, 2),
-                    'total_cost': sum(float(task.actual_cost or task.estimated_cost or 0) for task in tasks),
-                    'urgent_tasks': len([task for task in tasks if task.priority == 'urgent'])
-                })
+        for property_stats in property_maintenance_frequency:
+            total_cost = float(property_stats['total_cost'] or 0)
+
+            high_maintenance_properties.append({
+                'property': property_stats['rental_property__name'],
+                'task_count': property_stats['task_count'],
+                'avg_cost': round(total_cost / property_stats['task_count'], 2),
+                'total_cost': total_cost,
+                'urgent_tasks': property_stats['urgent_tasks']
+            })
 
         # Predictive insights based on patterns
         if prediction_accuracy > 80:
@@ -2798,14 +3102,13 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Seasonal maintenance patterns
-        seasonal_maintenance = {'Winter': 0, 'Spring': 0, 'Summer': 0, 'Fall': 0}
-        for task in maintenance_tasks:
-            if task.scheduled_date or task.created_at:
-                date = task.scheduled_date or task.created_at.date()
-                season = self._get_season_from_month(date.month)
-                seasonal_maintenance[season] += 1
+        task_months = np.fromiter(maintenance_tasks.annotate(
+            month=Coalesce(ExtractMonth('scheduled_date'), ExtractMonth('created_at'))
+        ).filter(month__isnull=False).values_list('month', flat=True), dtype=np.int8)
+        season_counts = np.bincount(_SEASON_IX_BY_MONTH[task_months], minlength=4)
+        seasonal_maintenance = dict(zip(_SEASON_NAMES, season_counts.tolist()))
 
-        peak_season = max(seasonal_maintenance.keys(), key=lambda x: seasonal_maintenance[x])
+        peak_season = max(seasonal_maintenance, key=seasonal_maintenance.get)
 
         predictive_insights.append({
             'title': f'Seasonal Maintenance Pattern - {peak_season}',
@@ -2816,7 +3119,7 @@ class BusinessIntelligenceView(TemplateView):
         })
 
         # Preventive vs reactive maintenance ratio
-        preventive_tasks = maintenance_tasks.filter(predicted_by_ai=True).count()
+        preventive_tasks = ai_predicted_count
         reactive_tasks = total_tasks - preventive_tasks
 
         if reactive_tasks > preventive_tasks:
@@ -2829,15 +3132,19 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Upcoming maintenance predictions
+        today = timezone.now().date()
         upcoming_predictions = maintenance_tasks.filter(
-            predicted_failure_date__gte=timezone.now().date(),
-            predicted_failure_date__lte=timezone.now().date() + timedelta(days=90),
+            predicted_failure_date__gte=today,
+            predicted_failure_date__lte=today + timedelta(days=90),
             status='pending'
+        ).select_related('rental_property').only(
+            'title', 'priority', 'estimated_cost', 'prediction_confidence', 'predicted_failure_date',
+            'rental_property__name'
         ).order_by('predicted_failure_date')
 
         upcoming_maintenance = []
         for task in upcoming_predictions:
-            days_until = (task.predicted_failure_date - timezone.now().date()).days
+            days_until = (task.predicted_failure_date - today).days
             upcoming_maintenance.append({
                 'task': task.title,
                 'property': task.rental_property.name,
@@ -2852,7 +3159,7 @@ class BusinessIntelligenceView(TemplateView):
             'total_estimated': float(total_estimated_cost),
             'total_actual': float(total_actual_cost),
             'variance_percentage': round(cost_variance, 1),
-            'savings_potential': float(total_actual_cost * 0.15),  # 15% potential savings
+            'savings_potential': float(total_actual_cost) * 0.15,  # 15% potential savings
             'optimization_strategies': [
                 'Implement bulk purchasing for common maintenance items',
                 'Negotiate better rates with preferred contractors',
@@ -2863,7 +3170,7 @@ class BusinessIntelligenceView(TemplateView):
 
         maintenance_intelligence = {
             'total_tasks': total_tasks,
-            'ai_predicted_tasks': ai_predicted_tasks.count(),
+            'ai_predicted_tasks': ai_predicted_count,
             'prediction_accuracy': round(prediction_accuracy, 1),
             'predictive_insights': predictive_insights,
             'cost_optimization': cost_optimization,
@@ -2877,14 +3184,17 @@ class BusinessIntelligenceView(TemplateView):
             'maintenance_intelligence': maintenance_intelligence,
         })
 
-    def _generate_guest_behavior_intelligence(self, context, user, bookings, reviews):
+    def _generate_guest_behavior_intelligence(self, context, bi):
         """Generate guest behavior intelligence"""
 
+        bookings, reviews = bi.bookings, bi.reviews
+        total_bookings = bi.total_bookings
+        review_count = bi.review_stats['count']
         guest_behavior = {}
         behavioral_insights = []
         guest_segments = {}
 
-        if not bookings.exists():
+        if not total_bookings:
             context.update({
                 'guest_behavior_intelligence': {
                     'message': 'No booking data available for guest behavior analysis.'
@@ -2892,60 +3202,60 @@ class BusinessIntelligenceView(TemplateView):
             })
             return
 
-        # Booking behavior analysis
+        # Booking behavior analysis over the three date columns, vectorized with pandas/numpy
+        booking_dates = pd.DataFrame.from_records(
+            list(bookings.values_list('check_in', 'check_out', 'created_at')),
+            columns=['check_in', 'check_out', 'created_at'])
+        check_in = pd.to_datetime(booking_dates['check_in'], utc=True)
+        check_out = pd.to_datetime(booking_dates['check_out'], utc=True)
+        created_at = pd.to_datetime(booking_dates['created_at'], utc=True)
+
+        lead_times = (check_in.dt.normalize() - created_at.dt.normalize()).dt.days.to_numpy()
+        stay_durations = (check_out - check_in).dt.days.to_numpy()
+
+        # Day-of-week and seasonal tallies are grouped in the database
+        booking_days = bookings.annotate(dow=ExtractIsoWeekDay('created_at')).values('dow').annotate(
+            count=Count('id')).order_by()
+        check_in_days = bookings.annotate(dow=ExtractIsoWeekDay('check_in')).values('dow').annotate(
+            count=Count('id')).order_by()
+        check_in_months = bookings.annotate(month=ExtractMonth('check_in')).values('month').annotate(
+            count=Count('id')).order_by()
+
+        seasonal_preference = {}
+        for row in check_in_months:
+            season = _SEASON_BY_MONTH[row['month'] - 1]
+            seasonal_preference[season] = seasonal_preference.get(season, 0) + row['count']
+
         booking_patterns = {
-            'lead_time': [],
-            'stay_duration': [],
-            'booking_day': {},
-            'check_in_day': {},
-            'seasonal_preference': {}
+            'lead_time': lead_times.tolist(),
+            'stay_duration': stay_durations.tolist(),
+            'booking_day': {_ISO_WEEKDAY_NAMES[row['dow']]: row['count'] for row in booking_days},
+            'check_in_day': {_ISO_WEEKDAY_NAMES[row['dow']]: row['count'] for row in check_in_days},
+            'seasonal_preference': seasonal_preference
         }
 
-        for booking in bookings:
-            # Lead time analysis
-            lead_time = (booking.check_in.date() - booking.created_at.date()).days
-            booking_patterns['lead_time'].append(lead_time)
-
-            # Stay duration analysis
-            stay_duration = (booking.check_out - booking.check_in).days
-            booking_patterns['stay_duration'].append(stay_duration)
-
-            # Booking day preferences
-            booking_day = booking.created_at.strftime('%A')
-            booking_patterns['booking_day'][booking_day] = booking_patterns['booking_day'].get(booking_day, 0) + 1
-
-            # Check-in day preferences
-            checkin_day = booking.check_in.strftime('%A')
-            booking_patterns['check_in_day'][checkin_day] = booking_patterns['check_in_day'].get(checkin_day, 0) + 1
-
-            # Seasonal preferences
-            season = self._get_season_from_month(booking.check_in.month)
-            booking_patterns['seasonal_preference'][season] = booking_patterns['seasonal_preference'].get(season, 0) + 1
-
-        # Calculate behavioral metrics
-        avg_lead_time = sum(booking_patterns['lead_time']) / len(booking_patterns['lead_time'])
-        avg_stay_duration = sum(booking_patterns['stay_duration']) / len(booking_patterns['stay_duration'])
-
-        # Guest segmentation based on behavior
-        last_minute_guests = sum(1 for lt in booking_patterns['lead_time'] if lt <= 7)
-        planners = sum(1 for lt in booking_patterns['lead_time'] if lt > 30)
+        # Calculate behavioral metrics and guest segmentation based on behavior
+        avg_lead_time = float(lead_times.mean())
+        avg_stay_duration = float(stay_durations.mean())
+        last_minute_guests = np.count_nonzero(lead_times <= 7)
+        planners = np.count_nonzero(lead_times > 30)
         weekend_guests = booking_patterns['check_in_day'].get('Friday', 0) + booking_patterns['check_in_day'].get(
             'Saturday', 0)
 
         guest_segments = {
             'last_minute_bookers': {
                 'count': last_minute_guests,
-                'percentage': round((last_minute_guests / bookings.count()) * 100, 1),
+                'percentage': round((last_minute_guests / total_bookings) * 100, 1),
                 'characteristics': ['Books within 7 days', 'Often pays premium', 'Less price sensitive']
             },
             'advance_planners': {
                 'count': planners,
-                'percentage': round((planners / bookings.count()) * 100, 1),
+                'percentage': round((planners / total_bookings) * 100, 1),
                 'characteristics': ['Books 30+ days ahead', 'Price conscious', 'Longer stays']
             },
             'weekend_travelers': {
                 'count': weekend_guests,
-                'percentage': round((weekend_guests / bookings.count()) * 100, 1),
+                'percentage': round((weekend_guests / total_bookings) * 100, 1),
                 'characteristics': ['Friday/Saturday arrivals', 'Leisure focused', 'Short stays']
             }
         }
@@ -2969,9 +3279,7 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Repeat guest analysis
-        guest_names = [booking.guest_name for booking in bookings]
-        repeat_guests = len(guest_names) - len(set(guest_names))
-        repeat_rate = (repeat_guests / bookings.count()) * 100
+        repeat_rate = bi.repeat_rate
 
         if repeat_rate > 20:
             behavioral_insights.append({
@@ -2990,19 +3298,14 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Review behavior analysis
-        if reviews.exists():
-            review_rate = (reviews.count() / bookings.count()) * 100
-            avg_review_delay = 0
+        if review_count:
+            review_rate = (review_count / total_bookings) * 100
 
             # Calculate average time between checkout and review
-            booking_reviews = []
-            for review in reviews:
-                if review.booking:
-                    review_delay = (review.review_date.date() - review.booking.check_out).days
-                    booking_reviews.append(review_delay)
-
-            if booking_reviews:
-                avg_review_delay = sum(booking_reviews) / len(booking_reviews)
+            review_delay = reviews.filter(booking__isnull=False).aggregate(
+                avg=Avg(ExpressionWrapper(F('review_date') - F('booking__check_out'), output_field=DurationField()))
+            )['avg']
+            avg_review_delay = review_delay.total_seconds() / 86400 if review_delay else 0
 
             behavioral_insights.append({
                 'title': 'Review Behavior Pattern',
@@ -3013,10 +3316,8 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Seasonal behavior analysis
-        peak_season = max(booking_patterns['seasonal_preference'].keys(),
-                          key=lambda x: booking_patterns['seasonal_preference'][x])
-        low_season = min(booking_patterns['seasonal_preference'].keys(),
-                         key=lambda x: booking_patterns['seasonal_preference'][x])
+        peak_season = max(seasonal_preference, key=seasonal_preference.get)
+        low_season = min(seasonal_preference, key=seasonal_preference.get)
 
         behavioral_insights.append({
             'title': f'Seasonal Preference - {peak_season}',
@@ -3026,13 +3327,19 @@ class BusinessIntelligenceView(TemplateView):
         })
 
         # Communication preferences (based on review responses)
-        if reviews.exists():
+        if review_count:
+            review_counts = reviews.annotate(content_length=Length('content')).aggregate(
+                quick_responders=Count('id', filter=Q(response_text__isnull=False)),
+                detailed_reviews=Count('id', filter=Q(content_length__gt=100)),
+                high_raters=Count('id', filter=Q(normalized_rating__gte=4.5)),
+                critical_raters=Count('id', filter=Q(normalized_rating__lt=3.5))
+            )
             response_preferences = {
-                'quick_responders': reviews.filter(response_text__isnull=False).count(),
-                'detailed_reviews': reviews.filter(content__len__gt=100).count(),
+                'quick_responders': review_counts['quick_responders'],
+                'detailed_reviews': review_counts['detailed_reviews'],
                 'rating_patterns': {
-                    'high_raters': reviews.filter(normalized_rating__gte=4.5).count(),
-                    'critical_raters': reviews.filter(normalized_rating__lt=3.5).count()
+                    'high_raters': review_counts['high_raters'],
+                    'critical_raters': review_counts['critical_raters']
                 }
             }
         else:
@@ -3040,20 +3347,20 @@ class BusinessIntelligenceView(TemplateView):
 
         # Booking channel preferences
         channel_preferences = {}
-        if bookings.exists():
+        if total_bookings:
             channels = bookings.values('channel').annotate(count=Count('id')).order_by('-count')
             for channel in channels:
                 channel_name = channel['channel'] or 'Direct'
                 channel_preferences[channel_name] = {
                     'count': channel['count'],
-                    'percentage': round((channel['count'] / bookings.count()) * 100, 1)
+                    'percentage': round((channel['count'] / total_bookings) * 100, 1)
                 }
 
         guest_behavior = {
             'avg_lead_time': round(avg_lead_time, 1),
             'avg_stay_duration': round(avg_stay_duration, 1),
             'repeat_rate': round(repeat_rate, 1),
-            'review_rate': round(review_rate, 1) if reviews.exists() else 0,
+            'review_rate': round(review_rate, 1) if review_count else 0,
             'behavioral_insights': behavioral_insights,
             'guest_segments': guest_segments,
             'booking_patterns': booking_patterns,
@@ -3067,7 +3374,15 @@ class BusinessIntelligenceView(TemplateView):
             'guest_behavior_intelligence': guest_behavior,
         })
 
-    def _calculate_performance_benchmarking(self, context, user, business_metrics, market_data):
+    def _calculate_performance_benchmarking(self, context, bi, business_metrics):
+        """Calculate performance benchmarking, cached per user for the day"""
+        context.update(cache.get_or_set(
+            _bi_cache_key('performance_benchmarking', bi.user.pk),
+            lambda: self._build_performance_benchmarking(bi, business_metrics),
+            settings.BI_CACHE_TTL
+        ))
+
+    def _build_performance_benchmarking(self, bi, business_metrics):
         """Calculate performance benchmarking against market and industry standards"""
 
         benchmarking_analysis = {}
@@ -3087,48 +3402,44 @@ class BusinessIntelligenceView(TemplateView):
                 }
 
         # Industry benchmarks (would come from external data sources)
-        industry_benchmarks = {
-            'occupancy_rate': 65.0,  # Industry average
-            'adr': 120.0,  # Industry average ADR
-            'guest_satisfaction': 4.2,  # Industry average rating
-            'response_rate': 85.0,  # Industry average review response rate
-            'repeat_guest_rate': 15.0,  # Industry average repeat rate
-            'review_rate': 35.0,  # Industry average review generation rate
-        }
+        industry_benchmarks = dict(_INDUSTRY_BENCHMARKS)
+        metric_names = _METRIC_NAMES
+        metric_titles = _METRIC_TITLES
 
         # Calculate user performance metrics
         user_metrics = {}
 
-        # Occupancy rate
-        properties = Property.objects.filter(owner=user)
-        bookings = Booking.objects.filter(property__owner=user)
+        # Booking totals for occupancy, ADR and repeat guests, shared across sections
+        booking_totals = bi.booking_totals
+        booking_count = bi.total_bookings
+        total_nights = booking_totals['total_stay'].total_seconds() / 86400 if booking_totals['total_stay'] else 0
 
-        if properties.exists() and bookings.exists():
-            total_possible_nights = properties.count() * 365
-            total_booked_nights = sum(
-                (booking.check_out - booking.check_in).days for booking in bookings
-            )
-            user_metrics['occupancy_rate'] = (total_booked_nights / total_possible_nights) * 100
+        # Occupancy rate
+        property_count = bi.property_count
+        if property_count and booking_count:
+            total_possible_nights = property_count * 365
+            user_metrics['occupancy_rate'] = (total_nights / total_possible_nights) * 100
 
         # Average daily rate
-        if bookings.exists():
-            total_revenue = sum(float(booking.total_amount) for booking in bookings)
-            total_nights = sum((booking.check_out - booking.check_in).days for booking in bookings)
+        if booking_count:
+            total_revenue = float(booking_totals['total_amount'] or 0)
             user_metrics['adr'] = total_revenue / total_nights if total_nights > 0 else 0
 
         # Guest satisfaction
-        reviews = Review.objects.filter(property__owner=user)
-        if reviews.exists():
-            user_metrics['guest_satisfaction'] = reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
-            user_metrics['response_rate'] = (reviews.filter(
-                response_text__isnull=False).count() / reviews.count()) * 100
-            user_metrics['review_rate'] = (reviews.count() / bookings.count()) * 100 if bookings.exists() else 0
+        review_totals = bi.reviews.aggregate(
+            count=Count('id'),
+            avg=Avg('normalized_rating'),
+            responded=Count('id', filter=Q(response_text__isnull=False))
+        )
+        if review_totals['count']:
+            user_metrics['guest_satisfaction'] = review_totals['avg'] or 0
+            user_metrics['response_rate'] = (review_totals['responded'] / review_totals['count']) * 100
+            user_metrics['review_rate'] = (review_totals['count'] / booking_count) * 100 if booking_count else 0
 
         # Repeat guest rate
-        if bookings.exists():
-            guest_names = [booking.guest_name for booking in bookings]
-            repeat_guests = len(guest_names) - len(set(guest_names))
-            user_metrics['repeat_guest_rate'] = (repeat_guests / bookings.count()) * 100
+        if booking_count:
+            repeat_guests = booking_count - bi.distinct_guests
+            user_metrics['repeat_guest_rate'] = (repeat_guests / booking_count) * 100
 
         # Performance comparison
         for metric, user_value in user_metrics.items():
@@ -3137,18 +3448,7 @@ class BusinessIntelligenceView(TemplateView):
                 performance_ratio = (user_value / industry_value) * 100
 
                 # Determine performance level
-                if performance_ratio >= 110:
-                    performance_level = 'Excellent'
-                    status = 'above'
-                elif performance_ratio >= 90:
-                    performance_level = 'Good'
-                    status = 'at'
-                elif performance_ratio >= 70:
-                    performance_level = 'Below Average'
-                    status = 'below'
-                else:
-                    performance_level = 'Poor'
-                    status = 'well_below'
+                performance_level, status = _ladder_at_least(_PERFORMANCE_LEVEL_LADDER, performance_ratio)
 
                 performance_comparison[metric] = {
                     'user_value': round(user_value, 2),
@@ -3162,7 +3462,7 @@ class BusinessIntelligenceView(TemplateView):
                 # Identify improvement areas
                 if performance_ratio < 90:
                     improvement_areas.append({
-                        'metric': metric.replace('_', ' ').title(),
+                        'metric': metric_titles[metric],
                         'current': round(user_value, 2),
                         'target': industry_value,
                         'gap': round(industry_value - user_value, 2),
@@ -3172,11 +3472,10 @@ class BusinessIntelligenceView(TemplateView):
 
         # Market comparison (if market data available)
         market_comparison = {}
-        if market_data.exists():
-            latest_market = market_data.order_by('-date').first()
-
+        latest_market = bi.latest_market
+        if latest_market is not None:
             if 'adr' in user_metrics:
-                market_adr = float(latest_market.average_daily_rate)
+                market_adr = bi.market_adr
                 market_comparison['adr'] = {
                     'user_value': user_metrics['adr'],
                     'market_value': market_adr,
@@ -3198,40 +3497,31 @@ class BusinessIntelligenceView(TemplateView):
         overall_score = sum(performance_scores) / len(performance_scores) if performance_scores else 0
 
         # Performance tier
-        if overall_score >= 110:
-            performance_tier = 'Top Performer'
-        elif overall_score >= 100:
-            performance_tier = 'Above Average'
-        elif overall_score >= 90:
-            performance_tier = 'Average'
-        elif overall_score >= 70:
-            performance_tier = 'Below Average'
-        else:
-            performance_tier = 'Needs Improvement'
+        performance_tier = _ladder_at_least(_PERFORMANCE_TIER_LADDER, overall_score)
 
         # Benchmarking insights
         benchmarking_insights = []
 
         # Top performing areas
-        top_metrics = sorted(performance_comparison.items(), key=lambda x: x[1]['performance_ratio'], reverse=True)[:2]
+        top_metrics = heapq.nlargest(2, performance_comparison.items(), key=lambda x: x[1]['performance_ratio'])
         for metric, data in top_metrics:
             if data['performance_ratio'] > 100:
                 benchmarking_insights.append({
                     'type': 'strength',
-                    'title': f'Strong {metric.replace("_", " ").title()} Performance',
-                    'description': f'Your {metric.replace("_", " ")} of {data["user_value"]} is {data["performance_ratio"]:.1f}% of industry average.',
+                    'title': f'Strong {metric_titles[metric]} Performance',
+                    'description': f'Your {metric_names[metric]} of {data["user_value"]} is {data["performance_ratio"]:.1f}% of industry average.',
                     'recommendation': 'Leverage this strength for competitive advantage'
                 })
 
         # Improvement opportunities
-        bottom_metrics = sorted(performance_comparison.items(), key=lambda x: x[1]['performance_ratio'])[:2]
+        bottom_metrics = heapq.nsmallest(2, performance_comparison.items(), key=lambda x: x[1]['performance_ratio'])
         for metric, data in bottom_metrics:
             if data['performance_ratio'] < 90:
                 benchmarking_insights.append({
                     'type': 'opportunity',
-                    'title': f'Improve {metric.replace("_", " ").title()}',
-                    'description': f'Your {metric.replace("_", " ")} is {data["performance_ratio"]:.1f}% of industry average.',
-                    'recommendation': f'Focus on improving {metric.replace("_", " ")} to reach industry standards'
+                    'title': f'Improve {metric_titles[metric]}',
+                    'description': f'Your {metric_names[metric]} is {data["performance_ratio"]:.1f}% of industry average.',
+                    'recommendation': f'Focus on improving {metric_names[metric]} to reach industry standards'
                 })
 
         benchmarking_analysis = {
@@ -3245,51 +3535,70 @@ class BusinessIntelligenceView(TemplateView):
             'industry_benchmarks': industry_benchmarks
         }
 
-        context.update({
+        return {
             'performance_benchmarking': benchmarking_analysis,
-        })
+        }
 
-    def _generate_growth_opportunity_intelligence(self, context, user, properties, bookings, market_data):
+    def _generate_growth_opportunity_intelligence(self, context, bi):
         """Generate growth opportunity intelligence"""
 
+        properties, bookings, market_data = bi.properties, bi.bookings, bi.market_data
         growth_opportunities = []
         market_analysis = {}
         expansion_potential = {}
 
         # Current performance baseline
-        current_revenue = Payment.objects.filter(
-            booking__property__owner=user,
-            status='completed'
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+        current_bookings = bi.total_bookings
+        if not current_bookings:
+            context.update({
+                'growth_opportunities': growth_opportunities,
+                'market_analysis': market_analysis,
+                'expansion_potential': expansion_potential,
+                'total_growth_potential': 0,
+            })
+            return
 
-        current_properties = properties.count()
-        current_bookings = bookings.count()
+        current_revenue = bi.current_revenue
+        current_properties = bi.property_count
 
         # Market expansion opportunities
-        if market_data.exists():
-            locations = market_data.values('location').distinct()
-            user_locations = set(properties.values_list('city', flat=True))
-
-            for location_data in locations:
-                location = location_data['location']
-                if location not in user_locations:
-                    location_market_data = market_data.filter(location=location).order_by('-date').first()
-
-                    if location_market_data:
-                        market_opportunity = self._assess_location_opportunity(location_market_data)
-
-                        if market_opportunity['score'] > 70:
-                            growth_opportunities.append({
-                                'type': 'Market Expansion',
-                                'title': f'Expand to {location}',
-                                'description': f'High-opportunity market with {market_opportunity["score"]:.1f}% opportunity score.',
-                                'potential_revenue': float(current_revenue) * 0.3,  # 30% of current revenue
-                                'investment_required': 'High',
-                                'timeline': '6-12 months',
-                                'risk_level': 'Medium',
-                                'success_probability': market_opportunity['score'],
-                                'requirements': ['Property acquisition', 'Market research', 'Local partnerships']
-                            })
+        if bi.latest_market is not None:
+            # Latest market row for each location the user is not yet in, in one query
+            latest_location_ids = market_data.filter(
+                location=OuterRef('location')
+            ).order_by('-date').values('id')[:1]
+            candidate_markets = market_data.exclude(
+                location__in=properties.values_list('city', flat=True)
+            ).filter(id=Subquery(latest_location_ids))
+
+            candidate_rows = list(candidate_markets.values_list(
+                'location', 'occupancy_rate', 'average_daily_rate', 'search_volume', 'events'
+            ))
+            if candidate_rows:
+                locations, occupancy, adr, search_volume, events = zip(*candidate_rows)
+                scores = _score_locations(
+                    np.array(occupancy, dtype=np.float64),
+                    np.array(adr, dtype=np.float64),
+                    np.array(search_volume, dtype=np.float64),
+                    np.fromiter(map(len, events), dtype=np.int64, count=len(events)),
+                )
+            else:
+                locations, scores = (), np.zeros(0, dtype=np.int64)
+
+            for ix in np.flatnonzero(scores > 70):
+                location = locations[ix]
+                score = int(scores[ix])
+                growth_opportunities.append({
+                    'type': 'Market Expansion',
+                    'title': f'Expand to {location}',
+                    'description': f'High-opportunity market with {score:.1f}% opportunity score.',
+                    'potential_revenue': float(current_revenue) * 0.3,  # 30% of current revenue
+                    'investment_required': 'High',
+                    'timeline': '6-12 months',
+                    'risk_level': 'Medium',
+                    'success_probability': score,
+                    'requirements': ['Property acquisition', 'Market research', 'Local partnerships']
+                })
 
         # Property portfolio expansion
         if current_properties < 5:  # Assuming small portfolio
@@ -3308,29 +3617,31 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Revenue optimization opportunities
-        if bookings.exists():
-            avg_booking_value = bookings.aggregate(avg=Avg('total_amount'))['avg'] or 0
+        avg_booking_value = bi.avg_booking_value
 
-            # Upselling opportunities
-            properties_with_amenities = properties.filter(amenities__isnull=False).count()  # Simplified
+        # Upselling opportunities
+        # EXISTS against the amenities join table, so properties with several amenities count once
+        properties_with_amenities = properties.filter(
+            Exists(Property.amenities.through.objects.filter(property_id=OuterRef('pk')))
+        ).count()
 
-            if properties_with_amenities < current_properties:
-                growth_opportunities.append({
-                    'type': 'Revenue Optimization',
-                    'title': 'Amenity Upselling Program',
-                    'description': f'Add premium amenities to increase booking value from ${avg_booking_value:.2f}',
-                    'potential_revenue': float(current_revenue) * 0.15,  # 15% increase
-                    'investment_required': 'Medium',
-                    'timeline': '2-4 months',
-                    'risk_level': 'Low',
-                    'success_probability': 90,
-                    'requirements': ['Amenity installation', 'Pricing strategy', 'Marketing update']
-                })
+        if properties_with_amenities < current_properties:
+            growth_opportunities.append({
+                'type': 'Revenue Optimization',
+                'title': 'Amenity Upselling Program',
+                'description': f'Add premium amenities to increase booking value from ${avg_booking_value:.2f}',
+                'potential_revenue': float(current_revenue) * 0.15,  # 15% increase
+                'investment_required': 'Medium',
+                'timeline': '2-4 months',
+                'risk_level': 'Low',
+                'success_probability': 90,
+                'requirements': ['Amenity installation', 'Pricing strategy', 'Marketing update']
+            })
 
         # Technology and automation opportunities
-        ai_insights = AIInsight.objects.filter(user=user)
-        automation_score = (ai_insights.filter(
-            is_implemented=True).count() / ai_insights.count() * 100) if ai_insights.exists() else 0
+        insight_counts = bi.ai_insight_counts
+        automation_score = (insight_counts['implemented'] / insight_counts['total'] * 100
+                            if insight_counts['total'] else 0)
 
         if automation_score < 60:
             growth_opportunities.append({
@@ -3349,8 +3660,8 @@ class BusinessIntelligenceView(TemplateView):
         long_stay_bookings = bookings.filter(
             check_out__gt=timezone.now() - timedelta(days=30)
         ).annotate(
-            duration=Count('check_out') - Count('check_in')
-        ).filter(duration__gte=7).count()
+            duration=ExpressionWrapper(F('check_out') - F('check_in'), output_field=DurationField())
+        ).filter(duration__gte=timedelta(days=7)).count()
 
         if long_stay_bookings > 0:
             growth_opportunities.append({
@@ -3383,13 +3694,7 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Guest experience and loyalty program
-        reviews = Review.objects.filter(property__owner=user)
-        repeat_rate = 0
-
-        if bookings.exists():
-            guest_names = [booking.guest_name for booking in bookings]
-            repeat_guests = len(guest_names) - len(set(guest_names))
-            repeat_rate = (repeat_guests / bookings.count()) * 100
+        repeat_rate = bi.repeat_rate
 
         if repeat_rate < 20:
             growth_opportunities.append({
@@ -3405,7 +3710,7 @@ class BusinessIntelligenceView(TemplateView):
             })
 
         # Seasonal optimization
-        seasonal_variance = self._calculate_seasonal_variance(bookings)
+        seasonal_variance = bi.seasonal_variance
         if seasonal_variance > 40:
             growth_opportunities.append({
                 'type': 'Seasonal Optimization',
@@ -3422,22 +3727,34 @@ class BusinessIntelligenceView(TemplateView):
         # Sort opportunities by potential revenue
         growth_opportunities.sort(key=lambda x: x['potential_revenue'], reverse=True)
 
-        # Market analysis summary
-        total_market_opportunity = sum(opp['potential_revenue'] for opp in growth_opportunities)
-        high_probability_opportunities = [opp for opp in growth_opportunities if opp['success_probability'] > 80]
+        # Market analysis summary, reduced in a single pass
+        total_market_opportunity = 0
+        high_probability_value = 0
+        success_probability_total = 0
+        quick_wins = []
+        major_initiatives = []
+        for opp in growth_opportunities:
+            total_market_opportunity += opp['potential_revenue']
+            success_probability_total += opp['success_probability']
+            if opp['success_probability'] > 80:
+                high_probability_value += opp['potential_revenue']
+            if opp['timeline'] == '1-2 months':
+                quick_wins.append(opp)
+            if opp['investment_required'] == 'High':
+                major_initiatives.append(opp)
 
         market_analysis = {
             'total_opportunity_value': total_market_opportunity,
-            'high_probability_value': sum(opp['potential_revenue'] for opp in high_probability_opportunities),
+            'high_probability_value': high_probability_value,
             'opportunity_count': len(growth_opportunities),
-            'avg_success_probability': sum(opp['success_probability'] for opp in growth_opportunities) / len(
+            'avg_success_probability': success_probability_total / len(
                 growth_opportunities) if growth_opportunities else 0,
-            'quick_wins': [opp for opp in growth_opportunities if opp['timeline'] == '1-2 months'],
-            'major_initiatives': [opp for opp in growth_opportunities if opp['investment_required'] == 'High']
+            'quick_wins': quick_wins,
+            'major_initiatives': major_initiatives
         }
 
         # Expansion potential assessment
-        expansion_readiness = self._assess_expansion_readiness(user, properties, bookings, reviews)
+        expansion_readiness = self._assess_expansion_readiness(bi)
 
         expansion_potential = {
             'readiness_score': expansion_readiness['score'],
@@ -3454,124 +3771,34 @@ class BusinessIntelligenceView(TemplateView):
             'total_growth_potential': total_market_opportunity,
         })
 
-    def _assess_location_opportunity(self, market_data):
-        """Assess opportunity score for a location"""
-        score = 0
-
-        # High occupancy indicates strong demand
-        if market_data.occupancy_rate > 80:
-            score += 30
-        elif market_data.occupancy_rate > 70:
-            score += 25
-        elif market_data.occupancy_rate > 60:
-            score += 20
-
-        # High ADR indicates profitable market
-        if market_data.average_daily_rate > 150:
-            score += 25
-        elif market_data.average_daily_rate > 100:
-            score += 20
-        elif market_data.average_daily_rate > 75:
-            score += 15
-
-        # High search volume indicates demand
-        if market_data.search_volume > 1000:
-            score += 25
-        elif market_data.search_volume > 500:
-            score += 20
-        elif market_data.search_volume > 200:
-            score += 15
-
-        # Events drive demand
-        if len(market_data.events) > 5:
-            score += 20
-        elif len(market_data.events) > 2:
-            score += 15
-        elif len(market_data.events) > 0:
-            score += 10
-
-        return {
-            'score': min(100, score),
-            'factors': {
-                'occupancy': market_data.occupancy_rate,
-                'adr': market_data.average_daily_rate,
-                'demand': market_data.search_volume,
-                'events': len(market_data.events)
-            }
-        }
-
-    def _assess_expansion_readiness(self, user, properties, bookings, reviews):
+    def _assess_expansion_readiness(self, bi):
         """Assess readiness for business expansion"""
         readiness_score = 0
 
         # Financial performance
-        if bookings.exists():
-            avg_booking_value = bookings.aggregate(avg=Avg('total_amount'))['avg'] or 0
-            if avg_booking_value > 200:
-                readiness_score += 25
-            elif avg_booking_value > 150:
-                readiness_score += 20
-            elif avg_booking_value > 100:
-                readiness_score += 15
+        if bi.total_bookings:
+            readiness_score += _ladder(_EXPANSION_BOOKING_VALUE_LADDER, bi.avg_booking_value)
 
         # Operational efficiency
-        if properties.count() >= 2:
-            readiness_score += 20
-        elif properties.count() >= 1:
-            readiness_score += 15
+        readiness_score += _ladder_at_least(_EXPANSION_PORTFOLIO_LADDER, bi.property_count)
 
         # Guest satisfaction
-        if reviews.exists():
-            avg_rating = reviews.aggregate(avg=Avg('normalized_rating'))['avg'] or 0
-            if avg_rating >= 4.5:
-                readiness_score += 25
-            elif avg_rating >= 4.0:
-                readiness_score += 20
-            elif avg_rating >= 3.5:
-                readiness_score += 15
+        review_count = bi.review_stats['count']
+        if review_count:
+            readiness_score += _ladder_at_least(_EXPANSION_RATING_LADDER, bi.review_stats['avg_rating'] or 0)
 
         # Review volume (indicates market presence)
-        review_count = reviews.count()
-        if review_count > 50:
-            readiness_score += 15
-        elif review_count > 20:
-            readiness_score += 10
-        elif review_count > 10:
-            readiness_score += 5
+        readiness_score += _ladder(_EXPANSION_REVIEW_VOLUME_LADDER, review_count)
 
         # Systems and processes
-        ai_insights = AIInsight.objects.filter(user=user)
-        if ai_insights.exists():
-            implementation_rate = ai_insights.filter(is_implemented=True).count() / ai_insights.count() * 100
-            if implementation_rate > 70:
-                readiness_score += 15
-            elif implementation_rate > 50:
-                readiness_score += 10
-            elif implementation_rate > 30:
-                readiness_score += 5
-
-        # Determine readiness level
-        if readiness_score >= 80:
-            readiness_level = 'Ready for Expansion'
-            capacity = 'High'
-        elif readiness_score >= 60:
-            readiness_level = 'Moderately Ready'
-            capacity = 'Medium'
-        elif readiness_score >= 40:
-            readiness_level = 'Preparation Needed'
-            capacity = 'Low'
-        else:
-            readiness_level = 'Not Ready'
-            capacity = 'Very Low'
-
-        # Next steps based on readiness
-        if readiness_score >= 80:
-            next_steps = ['Identify expansion opportunities', 'Secure financing', 'Develop expansion plan']
-        elif readiness_score >= 60:
-            next_steps = ['Improve operational efficiency', 'Strengthen financial position',
-                          'Enhance guest satisfaction']
-        else:
-            next_steps = ['Focus on current operations', 'Improve guest experience', 'Build stronger foundation']
+        insight_counts = bi.ai_insight_counts
+        if insight_counts['total']:
+            implementation_rate = insight_counts['implemented'] / insight_counts['total'] * 100
+            readiness_score += _ladder(_EXPANSION_IMPLEMENTATION_LADDER, implementation_rate)
+
+        # Determine readiness level and next steps
+        readiness_level, capacity = _ladder_at_least(_EXPANSION_LEVEL_LADDER, readiness_score)
+        next_steps = list(_ladder_at_least(_EXPANSION_NEXT_STEPS_LADDER, readiness_score))
 
         return {
             'score': readiness_score,
@@ -3581,59 +3808,82 @@ class BusinessIntelligenceView(TemplateView):
             'resources': ['Financial planning', 'Operational systems', 'Market research']
         }
 
-    def _analyze_operational_efficiency_intelligence(self, context, user, properties, bookings, maintenance_tasks):
+    def _analyze_operational_efficiency_intelligence(self, context, bi, maintenance_tasks):
         """Analyze operational efficiency intelligence"""
 
+        properties, bookings = bi.properties, bi.bookings
         efficiency_analysis = {}
         optimization_opportunities = []
         efficiency_metrics = {}
 
         # Resource utilization analysis
-        total_properties = properties.count()
-        total_bookings = bookings.count()
+        total_properties = bi.property_count
+        total_bookings = bi.total_bookings
 
-        if total_properties > 0 and total_bookings > 0:
+        if not total_bookings:
+            context.update({
+                'operational_efficiency_intelligence': {
+                    'message': 'No booking data available for operational efficiency analysis.'
+                }
+            })
+            return
+
+        if total_properties > 0:
             bookings_per_property = total_bookings / total_properties
 
-            # Property utilization
+            # Property utilization, grouped per property in the database
             property_utilization = {}
-            for property_obj in properties:
-                property_bookings = bookings.filter(property=property_obj)
-                property_nights = sum(
-                    (booking.check_out - booking.check_in).days
-                    for booking in property_bookings
-                )
+            available_nights = 365  # Simplified annual calculation
+            utilization_rows = bookings.annotate(
+                stay=ExpressionWrapper(F('check_out') - F('check_in'), output_field=DurationField())
+            ).values('property_id', 'property__name').annotate(
+                nights=Sum('stay'),
+                booking_count=Count('id'),
+                revenue=Sum('total_amount')
+            ).order_by()
+
+            booked_property_ids = []
+            for row in utilization_rows:
+                property_nights = row['nights'].days if row['nights'] else 0
+                booked_property_ids.append(row['property_id'])
 
                 # Calculate utilization (nights booked / nights available)
-                available_nights = 365  # Simplified annual calculation
                 utilization = (property_nights / available_nights) * 100
 
-                property_utilization[property_obj.name] = {
+                property_utilization[row['property__name']] = {
                     'utilization': round(utilization, 1),
-                    'bookings': property_bookings.count(),
+                    'bookings': row['booking_count'],
                     'nights_booked': property_nights,
-                    'revenue': sum(float(booking.total_amount) for booking in property_bookings)
+                    'revenue': float(row['revenue'] or 0)
+                }
+
+            # Properties without bookings are fully unutilized
+            for property_name in properties.exclude(id__in=booked_property_ids).values_list('name', flat=True):
+                property_utilization[property_name] = {
+                    'utilization': 0,
+                    'bookings': 0,
+                    'nights_booked': 0,
+                    'revenue': 0
                 }
 
         # Maintenance efficiency
-        if maintenance_tasks.exists():
-            total_maintenance_tasks = maintenance_tasks.count()
-            completed_tasks = maintenance_tasks.filter(status='completed').count()
-            overdue_tasks = maintenance_tasks.filter(
-                scheduled_date__lt=timezone.now().date(),
-                status='pending'
-            ).count()
+        maintenance_totals = maintenance_tasks.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(status='completed')),
+            overdue=Count('id', filter=Q(scheduled_date__lt=timezone.now().date(), status='pending')),
+            budgeted_cost=Sum('estimated_cost'),
+            actual_cost=Sum('actual_cost')
+        )
+        if maintenance_totals['total']:
+            total_maintenance_tasks = maintenance_totals['total']
+            completed_tasks = maintenance_totals['completed']
+            overdue_tasks = maintenance_totals['overdue']
 
             maintenance_efficiency = (completed_tasks / total_maintenance_tasks) * 100
 
             # Cost efficiency
-            budgeted_cost = maintenance_tasks.filter(
-                estimated_cost__isnull=False
-            ).aggregate(total=Sum('estimated_cost'))['total'] or Decimal('0.00')
-
-            actual_cost = maintenance_tasks.filter(
-                actual_cost__isnull=False
-            ).aggregate(total=Sum('actual_cost'))['total'] or Decimal('0.00')
+            budgeted_cost = maintenance_totals['budgeted_cost'] or Decimal('0.00')
+            actual_cost = maintenance_totals['actual_cost'] or Decimal('0.00')
 
             cost_efficiency = 100 - (
                         ((actual_cost - budgeted_cost) / budgeted_cost) * 100) if budgeted_cost > 0 else 100
@@ -3643,21 +3893,23 @@ class BusinessIntelligenceView(TemplateView):
             overdue_tasks = 0
 
         # Booking process efficiency
-        if bookings.exists():
+        if total_bookings:
             # Lead time analysis
-            lead_times = [(booking.check_in.date() - booking.created_at.date()).days for booking in bookings]
-            avg_lead_time = sum(lead_times) / len(lead_times)
+            avg_lead = bookings.aggregate(
+                avg=Avg(ExpressionWrapper(F('check_in') - F('created_at'), output_field=DurationField()))
+            )['avg']
+            avg_lead_time = avg_lead.total_seconds() / 86400 if avg_lead else 0
 
             # Booking conversion (simplified - would need actual conversion data)
-            conversion_rate = random.randint(15, 35)  # Placeholder
+            conversion_rate = _DEFAULT_CONVERSION_RATE
 
             # Response time analysis (if available)
             # This would need actual response time data
-            avg_response_time = random.randint(2, 24)  # Hours
+            avg_response_time = _DEFAULT_RESPONSE_TIME_HOURS
 
         # Financial efficiency
-        if bookings.exists():
-            total_revenue = sum(float(booking.total_amount) for booking in bookings)
+        if total_bookings:
+            total_revenue = float(bi.booking_totals['total_amount'] or 0)
             revenue_per_booking = total_revenue / total_bookings
             revenue_per_property = total_revenue / total_properties
 
@@ -3752,14 +4004,7 @@ class BusinessIntelligenceView(TemplateView):
         overall_efficiency = sum(efficiency_scores) / len(efficiency_scores)
 
         # Efficiency level
-        if overall_efficiency >= 85:
-            efficiency_level = 'Highly Efficient'
-        elif overall_efficiency >= 70:
-            efficiency_level = 'Efficient'
-        elif overall_efficiency >= 55:
-            efficiency_level = 'Moderately Efficient'
-        else:
-            efficiency_level = 'Needs Improvement'
+        efficiency_level = _ladder_at_least(_EFFICIENCY_LEVEL_LADDER, overall_efficiency)
 
         # Automation opportunities
         automation_opportunities = []
@@ -4,14 +4,21 @@ This module analyzes guest behavior and preferences to enhance their experience.
 Location: booking_vision_APP/ai/guest_experience.py
 """
 import json
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, List, Any
+from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict
+from operator import attrgetter
+from typing import Dict, List, Any, Tuple
 import logging
 
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Max, Min, Prefetch, QuerySet
+from django.db.models.functions import ExtractIsoWeekDay, ExtractMonth
+
 from ..models.bookings import Booking, Guest, BookingMessage
 from ..models.ai_models import GuestPreference
-from .sentiment_analysis import SentimentAnalyzer
+from .sentiment_analysis import KeywordMatcher, SentimentAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -39,26 +46,69 @@ class GuestExperienceEngine:
         }
     }
 
+    # Keyword -> guest type, flattened from GUEST_TYPES
+    KEYWORD_TYPES = {
+        keyword: guest_type for guest_type, config in GUEST_TYPES.items() for keyword in config['keywords']
+    }
+    KEYWORD_MATCHER = KeywordMatcher(KEYWORD_TYPES)
+
+    # Response templates for different scenarios
+    RESPONSE_TEMPLATES = {
+        'welcome_business': (
+            "Welcome! We've prepared a quiet workspace for you.",
+            "Hello! Your room includes complimentary WiFi and a desk area.",
+            "Welcome! We know business travelers value efficiency - we're here to help."
+        ),
+        'welcome_family': (
+            "Welcome to our family-friendly property!",
+            "Hi! We've made sure your room is safe and comfortable for the whole family.",
+            "Welcome! The kids will love our family amenities."
+        ),
+        'welcome_leisure': (
+            "Welcome! We hope you have a wonderful and relaxing stay.",
+            "Hello! We're excited to help make your vacation memorable.",
+            "Welcome to your home away from home!"
+        ),
+        'follow_up_positive': (
+            "We're so glad you're enjoying your stay!",
+            "Thank you for the positive feedback!",
+            "We're thrilled everything is going well!"
+        ),
+        'follow_up_negative': (
+            "We sincerely apologize and want to make this right.",
+            "Thank you for bringing this to our attention.",
+            "We're working immediately to resolve this issue."
+        )
+    }
+
     def __init__(self):
         self.sentiment_analyzer = SentimentAnalyzer()
 
     def analyze_guest(self, guest: Guest, booking: Booking = None) -> Dict[str, Any]:
         """Comprehensive analysis of guest preferences and behavior"""
         try:
+            now = datetime.now()
+            today = now.date()
+
             # Get or create guest preferences
             preferences, created = GuestPreference.objects.get_or_create(guest=guest)
 
-            # Analyze all guest bookings
-            guest_bookings = Booking.objects.filter(guest=guest).order_by('-created_at')
+            # Load all guest bookings and their guest messages once
+            guest_bookings, guest_messages = self._load_guest_context(guest)
+
+            # Score every guest message once, shared by communication and satisfaction analysis
+            sentiment_scores = self._message_sentiment_scores(guest_messages)
 
             # Analyze guest type
-            guest_type = self.classify_guest_type(guest, guest_bookings)
+            guest_type = self.classify_guest_type(guest, guest_bookings, guest_messages)
 
             # Analyze communication patterns
-            communication_analysis = self.analyze_communication_patterns(guest)
+            communication_analysis = self.analyze_communication_patterns(guest, guest_bookings, guest_messages,
+                                                                         sentiment_scores)
 
             # Calculate satisfaction score
-            satisfaction_score = self.calculate_satisfaction_score(guest, guest_bookings)
+            satisfaction_score = self.calculate_satisfaction_score(guest, guest_bookings, guest_messages,
+                                                                   sentiment_scores, today)
 
             # Generate personalized recommendations
             recommendations = self.generate_recommendations(guest, guest_type, satisfaction_score)
@@ -68,7 +118,7 @@ class GuestExperienceEngine:
                 'guest_type': guest_type,
                 'satisfaction_score': satisfaction_score,
                 'communication_preference': communication_analysis['preference'],
-                'last_analyzed': datetime.now().isoformat()
+                'last_analyzed': now.isoformat()
             })
 
             return {
@@ -78,7 +128,7 @@ class GuestExperienceEngine:
                 'booking_patterns': self.analyze_booking_patterns(guest_bookings),
                 'preferences': self.extract_preferences(guest, guest_bookings),
                 'recommendations': recommendations,
-                'loyalty_indicators': self.calculate_loyalty_indicators(guest_bookings)
+                'loyalty_indicators': self.calculate_loyalty_indicators(guest_bookings, today)
             }
 
         except Exception as e:
@@ -90,19 +140,50 @@ class GuestExperienceEngine:
                 'recommendations': []
             }
 
-    def classify_guest_type(self, guest: Guest, bookings: List[Booking]) -> str:
+    def _load_guest_context(self, guest: Guest) -> Tuple[List[Booking], List[BookingMessage]]:
+        """Fetch guest bookings (newest first) and their guest messages (oldest first) in two queries"""
+        bookings = list(
+            Booking.objects.filter(guest=guest)
+            .select_related('rental_property')
+            .only('check_in_date', 'check_out_date', 'num_guests', 'total_price', 'created_at',
+                  'rental_property__property_type', 'rental_property__city')
+            .prefetch_related(Prefetch(
+                'messages',
+                queryset=BookingMessage.objects.filter(sender='guest').only('booking', 'message', 'created_at'),
+                to_attr='guest_msgs'
+            ))
+            .order_by('-created_at')
+        )
+        messages = sorted((message for b in bookings for message in b.guest_msgs), key=attrgetter('created_at'))
+        return bookings, messages
+
+    def _message_sentiment_scores(self, messages: List[BookingMessage]) -> np.ndarray:
+        """Sentiment score per message in hundredths, analysing only the messages missing from the cache in one batch"""
+        # Polarity (-1 to 1) is kept in whole hundredths, which fits an int8
+        keys = [f'guest_sentiment_pct:{message.pk}' for message in messages]
+        centi_scores = cache.get_many(keys)
+
+        misses = [(key, message) for key, message in zip(keys, messages) if key not in centi_scores]
+        if misses:
+            results = self.sentiment_analyzer.batch_analyze([message.message for _, message in misses])
+            for (key, _), result in zip(misses, results):
+                centi_scores[key] = round(result['score'] * 100)
+            # Failed analyses score as neutral for this run and are not cached, so they are retried
+            cache.set_many({
+                key: centi_scores[key] for (key, _), result in zip(misses, results) if 'error' not in result
+            }, settings.SENTIMENT_CACHE_TTL)
+
+        return np.array([centi_scores[key] for key in keys], dtype=np.int8)
+
+    def classify_guest_type(self, guest: Guest, bookings: List[Booking], messages: List[BookingMessage]) -> str:
         """Classify guest type based on booking history and communication"""
         type_scores = defaultdict(int)
 
         # Analyze booking messages for keywords
-        for booking in bookings:
-            messages = BookingMessage.objects.filter(booking=booking, sender='guest')
-            for message in messages:
-                text = message.message.lower()
-                for guest_type, config in self.GUEST_TYPES.items():
-                    for keyword in config['keywords']:
-                        if keyword in text:
-                            type_scores[guest_type] += 1
+        for message in messages:
+            text = message.message.lower()
+            for keyword in self.KEYWORD_MATCHER.find(text):
+                type_scores[self.KEYWORD_TYPES[keyword]] += 1
 
         # Analyze booking patterns
         if bookings:
@@ -127,14 +208,10 @@ class GuestExperienceEngine:
         else:
             return 'leisure'  # Default
 
-    def analyze_communication_patterns(self, guest: Guest) -> Dict[str, Any]:
-        """Analyze how the guest prefers to communicate"""
-        guest_bookings = Booking.objects.filter(guest=guest)
-        all_messages = BookingMessage.objects.filter(
-            booking__in=guest_bookings,
-            sender='guest'
-        ).order_by('created_at')
-
+    def analyze_communication_patterns(self, guest: Guest, guest_bookings: List[Booking],
+                                       all_messages: List[BookingMessage],
+                                       sentiment_scores: np.ndarray) -> Dict[str, Any]:
+        """Analyze how the guest prefers to communicate; sentiment scores are in hundredths of polarity"""
         if not all_messages:
             return {
                 'preference': 'minimal',
@@ -143,21 +220,8 @@ class GuestExperienceEngine:
                 'sentiment_trend': 'neutral'
             }
 
-        # Analyze message timing
-        response_times = []
-        message_lengths = []
-        sentiments = []
-
-        for message in all_messages:
-            # Message length
-            message_lengths.append(len(message.message))
-
-            # Sentiment analysis
-            sentiment_result = self.sentiment_analyzer.analyze(message.message)
-            sentiments.append(sentiment_result['score'])
-
         # Determine communication preference
-        avg_length = sum(message_lengths) / len(message_lengths) if message_lengths else 0
+        avg_length = sum(len(message.message) for message in all_messages) / len(all_messages)
         message_frequency = len(all_messages) / max(len(guest_bookings), 1)
 
         if message_frequency > 3 and avg_length > 100:
@@ -167,12 +231,12 @@ class GuestExperienceEngine:
         else:
             preference = 'minimal'
 
-        # Calculate sentiment trend
-        if sentiments:
-            avg_sentiment = sum(sentiments) / len(sentiments)
-            if avg_sentiment > 0.2:
+        # Calculate sentiment trend; the average is compared against +/-0.2 in exact integer hundredths
+        if sentiment_scores.size:
+            sentiment_total = int(sentiment_scores.sum(dtype=np.int64))
+            if sentiment_total > 20 * sentiment_scores.size:
                 sentiment_trend = 'positive'
-            elif avg_sentiment < -0.2:
+            elif sentiment_total < -20 * sentiment_scores.size:
                 sentiment_trend = 'negative'
             else:
                 sentiment_trend = 'neutral'
@@ -187,23 +251,16 @@ class GuestExperienceEngine:
             'total_messages': len(all_messages)
         }
 
-    def calculate_satisfaction_score(self, guest: Guest, bookings: List[Booking]) -> float:
-        """Calculate overall guest satisfaction score"""
+    def calculate_satisfaction_score(self, guest: Guest, bookings: List[Booking],
+                                     all_messages: List[BookingMessage], sentiment_scores: np.ndarray,
+                                     today: date = None) -> float:
+        """Calculate overall guest satisfaction score; bookings are ordered newest first and
+        sentiment scores are in hundredths of polarity"""
         if not bookings:
             return 3.0  # Neutral default
 
-        # Analyze message sentiments
-        all_messages = BookingMessage.objects.filter(
-            booking__in=bookings,
-            sender='guest'
-        )
-
-        sentiment_scores = []
-        for message in all_messages:
-            sentiment = self.sentiment_analyzer.analyze(message.message)
-            # Convert polarity (-1 to 1) to satisfaction score (1 to 5)
-            satisfaction = 3 + (sentiment['score'] * 2)
-            sentiment_scores.append(max(1, min(5, satisfaction)))
+        # Analyze message sentiments: convert polarity (-1 to 1) to satisfaction score (1 to 5)
+        message_satisfaction = np.clip(3 + sentiment_scores * 0.02, 1, 5)
 
         # Consider booking patterns
         pattern_score = 3.0
@@ -215,14 +272,14 @@ class GuestExperienceEngine:
         if len(bookings) > 3:
             pattern_score += 0.5
 
-        # Recent bookings weighted more heavily
-        recent_bookings = [b for b in bookings if b.created_at.date() > datetime.now().date() - timedelta(days=180)]
-        if recent_bookings:
+        # Recent bookings weighted more heavily; the newest booking decides
+        cutoff_180 = (today or datetime.now().date()) - timedelta(days=180)
+        if bookings[0].created_at.date() > cutoff_180:
             pattern_score += 0.3
 
         # Combine sentiment and pattern scores
-        if sentiment_scores:
-            sentiment_avg = sum(sentiment_scores) / len(sentiment_scores)
+        if message_satisfaction.size:
+            sentiment_avg = float(message_satisfaction.mean())
             final_score = (sentiment_avg * 0.7) + (pattern_score * 0.3)
         else:
             final_score = pattern_score
@@ -230,31 +287,64 @@ class GuestExperienceEngine:
         return round(max(1.0, min(5.0, final_score)), 2)
 
     def analyze_booking_patterns(self, bookings: List[Booking]) -> Dict[str, Any]:
-        """Analyze guest booking patterns"""
+        """Analyze guest booking patterns; a list of bookings must be ordered newest first"""
+        if isinstance(bookings, QuerySet):
+            return self._aggregate_booking_patterns(bookings)
+
         if not bookings:
             return {}
 
-        # Timing patterns
-        months = [b.check_in_date.month for b in bookings]
-        weekdays = [b.check_in_date.weekday() for b in bookings]
+        # One pass over the bookings filling timing, stay, guest count and spending columns
+        n = len(bookings)
+        months = np.empty(n, dtype=np.int8)
+        weekdays = np.empty(n, dtype=np.int8)
+        durations = np.empty(n, dtype=np.int32)
+        guest_counts = np.empty(n, dtype=np.int32)
+        spending = np.empty(n, dtype=np.float64)
+        for i, b in enumerate(bookings):
+            check_in = b.check_in_date
+            months[i] = check_in.month
+            weekdays[i] = check_in.weekday()
+            durations[i] = b.nights
+            guest_counts[i] = b.num_guests
+            spending[i] = b.total_price
 
-        # Stay duration patterns
-        durations = [b.nights for b in bookings]
+        return {
+            'preferred_months': int(np.bincount(months).argmax()),
+            'preferred_weekdays': int(np.bincount(weekdays).argmax()),
+            'average_stay_duration': float(durations.mean()),
+            'typical_guest_count': int(np.bincount(guest_counts).argmax()),
+            'average_spending': float(spending.mean()),
+            'total_bookings': len(bookings),
+            'booking_frequency': self.calculate_booking_frequency(bookings)
+        }
 
-        # Guest count patterns
-        guest_counts = [b.num_guests for b in bookings]
+    def _aggregate_booking_patterns(self, bookings: QuerySet) -> Dict[str, Any]:
+        """analyze_booking_patterns computed in the database for a booking queryset"""
+        totals = bookings.aggregate(
+            total=Count('id'),
+            avg_stay=Avg(ExpressionWrapper(F('check_out_date') - F('check_in_date'), output_field=DurationField())),
+            avg_spending=Avg('total_price'),
+            first_created=Min('created_at'),
+            last_created=Max('created_at')
+        )
+        if not totals['total']:
+            return {}
 
-        # Spending patterns
-        spending = [float(b.total_price) for b in bookings]
+        def most_common(expression):
+            # Ties go to the smallest value, as np.bincount(...).argmax() does for lists
+            return bookings.annotate(value=expression).values('value').annotate(
+                count=Count('id')).order_by('-count', 'value').first()['value']
 
         return {
-            'preferred_months': self.find_most_common(months),
-            'preferred_weekdays': self.find_most_common(weekdays),
-            'average_stay_duration': sum(durations) / len(durations),
-            'typical_guest_count': self.find_most_common(guest_counts),
-            'average_spending': sum(spending) / len(spending),
-            'total_bookings': len(bookings),
-            'booking_frequency': self.calculate_booking_frequency(bookings)
+            'preferred_months': most_common(ExtractMonth('check_in_date')),
+            'preferred_weekdays': most_common(ExtractIsoWeekDay('check_in_date')) - 1,  # Monday == 0, as weekday()
+            'average_stay_duration': totals['avg_stay'].total_seconds() / 86400 if totals['avg_stay'] else 0,
+            'typical_guest_count': most_common(F('num_guests')),
+            'average_spending': float(totals['avg_spending'] or 0),
+            'total_bookings': totals['total'],
+            'booking_frequency': self._bookings_per_year(totals['total'], totals['first_created'],
+                                                         totals['last_created'])
         }
 
     def extract_preferences(self, guest: Guest, bookings: List[Booking]) -> Dict[str, Any]:
@@ -324,15 +414,18 @@ class GuestExperienceEngine:
 
         return recommendations[:5]  # Return top 5 recommendations
 
-    def calculate_loyalty_indicators(self, bookings: List[Booking]) -> Dict[str, Any]:
-        """Calculate guest loyalty indicators"""
+    def calculate_loyalty_indicators(self, bookings: List[Booking], today: date = None) -> Dict[str, Any]:
+        """Calculate guest loyalty indicators; bookings are ordered newest first"""
         if not bookings:
             return {'loyalty_score': 0, 'likelihood_to_return': 'low'}
 
+        today = today or datetime.now().date()
+        cutoff_90 = today - timedelta(days=90)
+
         # Factors affecting loyalty
         repeat_bookings = len(bookings) > 1
-        recent_booking = any(b.created_at.date() > datetime.now().date() - timedelta(days=90) for b in bookings)
-        booking_frequency = len(bookings) / max((datetime.now().date() - bookings[-1].created_at.date()).days / 365,
+        recent_booking = bookings[0].created_at.date() > cutoff_90
+        booking_frequency = len(bookings) / max((today - bookings[-1].created_at.date()).days / 365,
                                                 0.25)
 
         # Calculate loyalty score
@@ -364,55 +457,33 @@ class GuestExperienceEngine:
             'booking_frequency': round(booking_frequency, 2)
         }
 
-    def get_response_templates(self) -> Dict[str, List[str]]:
+    def get_response_templates(self) -> Dict[str, Tuple[str, ...]]:
         """Get response templates for different scenarios"""
-        return {
-            'welcome_business': [
-                "Welcome! We've prepared a quiet workspace for you.",
-                "Hello! Your room includes complimentary WiFi and a desk area.",
-                "Welcome! We know business travelers value efficiency - we're here to help."
-            ],
-            'welcome_family': [
-                "Welcome to our family-friendly property!",
-                "Hi! We've made sure your room is safe and comfortable for the whole family.",
-                "Welcome! The kids will love our family amenities."
-            ],
-            'welcome_leisure': [
-                "Welcome! We hope you have a wonderful and relaxing stay.",
-                "Hello! We're excited to help make your vacation memorable.",
-                "Welcome to your home away from home!"
-            ],
-            'follow_up_positive': [
-                "We're so glad you're enjoying your stay!",
-                "Thank you for the positive feedback!",
-                "We're thrilled everything is going well!"
-            ],
-            'follow_up_negative': [
-                "We sincerely apologize and want to make this right.",
-                "Thank you for bringing this to our attention.",
-                "We're working immediately to resolve this issue."
-            ]
-        }
+        return self.RESPONSE_TEMPLATES
 
     # Helper methods
     def find_most_common(self, items: List) -> Any:
         """Find the most common item in a list"""
         if not items:
             return None
-        return max(set(items), key=items.count)
+        return Counter(items).most_common(1)[0][0]
 
     def calculate_booking_frequency(self, bookings: List[Booking]) -> float:
-        """Calculate how frequently guest books (bookings per year)"""
+        """Calculate how frequently guest books (bookings per year); bookings are ordered newest first"""
         if len(bookings) < 2:
             return 0
 
-        first_booking = min(bookings, key=lambda b: b.created_at)
-        last_booking = max(bookings, key=lambda b: b.created_at)
+        return self._bookings_per_year(len(bookings), bookings[-1].created_at, bookings[0].created_at)
+
+    def _bookings_per_year(self, booking_count: int, first_created: datetime, last_created: datetime) -> float:
+        """Bookings per year across the span between the first and last booking"""
+        if booking_count < 2:
+            return 0
 
-        days_span = (last_booking.created_at.date() - first_booking.created_at.date()).days
+        days_span = (last_created.date() - first_created.date()).days
         years_span = max(days_span / 365, 0.25)  # Minimum 3 months
 
-        return len(bookings) / years_span
+        return booking_count / years_span
 
     def update_guest_preferences(self, preferences: GuestPreference, data: Dict[str, Any]) -> None:
         """Update guest preferences in database"""
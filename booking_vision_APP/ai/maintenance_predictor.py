@@ -4,11 +4,14 @@ This module predicts maintenance needs using machine learning.
 Location: booking_vision_APP/ai/maintenance_predictor.py
 """
 import numpy as np
+from bisect import bisect_left
 from datetime import datetime, timedelta
-import random
 from collections import defaultdict
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
+
 from ..models.properties import Property
 from ..models.bookings import Booking
 from ..models.ai_models import MaintenanceTask
@@ -16,6 +19,16 @@ from ..models.ai_models import MaintenanceTask
 logger = logging.getLogger(__name__)
 
 
+def prediction_cache_key(property_id, today=None):
+    """Cache key for a property's maintenance predictions for today"""
+    return f'maint_pred:{property_id}:{(today or datetime.now().date()).isoformat()}'
+
+
+def _days_until_due(intervals, days_since, usage, seasonal, age):
+    """Days until each maintenance type is due, from its base interval shortened by the combined factors"""
+    return intervals / (usage * seasonal * age) - days_since
+
+
 class MaintenancePredictor:
     """AI system for predicting maintenance needs"""
 
@@ -33,6 +46,17 @@ class MaintenancePredictor:
         'Carpet Cleaning': {'interval': 120, 'priority': 'medium', 'cost': 250}
     }
 
+    # Maintenance types and their intervals as parallel arrays, in MAINTENANCE_SCHEDULES order
+    SCHEDULE_TYPES = tuple(MAINTENANCE_SCHEDULES)
+    SCHEDULE_INTERVALS = np.array([schedule['interval'] for schedule in MAINTENANCE_SCHEDULES.values()],
+                                  dtype=np.float64)
+    # Booking statuses that count towards property usage
+    USAGE_BOOKING_STATUSES = ('confirmed', 'checked_in', 'checked_out')
+    # Upper bounds (in years) of the new and moderate property age bands
+    AGE_BAND_YEARS = (2, 5)
+    # Lowercased maintenance type -> type, for matching task titles
+    SCHEDULE_TYPES_LOWER = {mtype.lower(): mtype for mtype in MAINTENANCE_SCHEDULES}
+
     def __init__(self):
         self.failure_patterns = self.load_failure_patterns()
 
@@ -60,90 +84,102 @@ class MaintenancePredictor:
         }
 
     def predict_maintenance_needs(self, property):
-        """Predict upcoming maintenance needs for a property"""
-        predictions = []
+        """Predict upcoming maintenance needs for a property, cached per property for the day"""
         today = datetime.now().date()
+        predictions = cache.get_or_set(
+            prediction_cache_key(property.pk, today),
+            lambda: self._predict_maintenance_needs(
+                property, self.calculate_usage_metrics(property, today), self.get_last_maintenance_dates(property),
+                today
+            ),
+            settings.MAINTENANCE_PREDICTION_CACHE_TTL
+        )
+        return [dict(prediction, property=property) for prediction in predictions]
 
-        # Get property usage metrics
-        usage_metrics = self.calculate_usage_metrics(property)
-
-        # Get last maintenance dates
-        last_maintenance = self.get_last_maintenance_dates(property)
-
-        # Predict for each maintenance type
-        for maintenance_type, schedule in self.MAINTENANCE_SCHEDULES.items():
-            # Calculate days since last maintenance
-            last_date = last_maintenance.get(maintenance_type)
-            if last_date:
-                days_since = (today - last_date).days
-            else:
-                # Assume needs maintenance if no record
-                days_since = schedule['interval']
-
-            # Apply usage factor
-            usage_factor = self.calculate_usage_factor(
-                property, maintenance_type, usage_metrics
-            )
-
-            # Apply seasonal factor
-            seasonal_factor = self.calculate_seasonal_factor(maintenance_type)
-
-            # Apply age factor
-            age_factor = self.calculate_age_factor(property)
-
-            # Calculate adjusted interval
-            adjusted_interval = schedule['interval'] / (usage_factor * seasonal_factor * age_factor)
-
-            # Calculate days until maintenance
-            days_until = adjusted_interval - days_since
-
-            # Add prediction if maintenance is due soon
-            if days_until <= 30:  # Within 30 days
-                confidence = self.calculate_confidence(days_until, usage_metrics)
-
-                predictions.append({
-                    'property': property,
-                    'maintenance_type': maintenance_type,
-                    'days_until': max(0, int(days_until)),
-                    'priority': self.adjust_priority(schedule['priority'], days_until),
-                    'estimated_cost': schedule['cost'],
-                    'confidence': confidence,
-                    'factors': {
-                        'usage': usage_factor,
-                        'seasonal': seasonal_factor,
-                        'age': age_factor
-                    }
-                })
+    def _predict_maintenance_needs(self, property, usage_metrics, last_maintenance, today):
+        """Predict maintenance needs from usage metrics and last maintenance dates, without the property"""
+        predictions = []
+        current_season = self.get_current_season(today)
+
+        # Days since last maintenance per type; assume maintenance is needed if there is no record
+        maintenance_types = self.SCHEDULE_TYPES
+        days_since = np.array([
+            (today - last_maintenance[mtype]).days if last_maintenance.get(mtype) else interval
+            for mtype, interval in zip(maintenance_types, self.SCHEDULE_INTERVALS)
+        ], dtype=np.float64)
+
+        # Usage, seasonal and age factors per type
+        usage_factors = np.array([
+            self.calculate_usage_factor(property, mtype, usage_metrics) for mtype in maintenance_types
+        ])
+        seasonal_factors = np.array([
+            self.calculate_seasonal_factor(mtype, current_season) for mtype in maintenance_types
+        ])
+        age_factor = self.calculate_age_factor(property, today)
+
+        # Days until maintenance for every type at once
+        days_until_due = _days_until_due(self.SCHEDULE_INTERVALS, days_since, usage_factors, seasonal_factors,
+                                         age_factor)
+
+        # Add predictions for maintenance due within 30 days
+        for ix in np.flatnonzero(days_until_due <= 30):
+            maintenance_type = maintenance_types[ix]
+            schedule = self.MAINTENANCE_SCHEDULES[maintenance_type]
+            days_until = float(days_until_due[ix])
+            confidence = self.calculate_confidence(days_until, usage_metrics)
+
+            predictions.append({
+                'maintenance_type': maintenance_type,
+                'days_until': max(0, int(days_until)),
+                'priority': self.adjust_priority(schedule['priority'], days_until),
+                'estimated_cost': schedule['cost'],
+                'confidence': confidence,
+                'factors': {
+                    'usage': float(usage_factors[ix]),
+                    'seasonal': float(seasonal_factors[ix]),
+                    'age': age_factor
+                }
+            })
 
         return sorted(predictions, key=lambda x: x['days_until'])
 
-    def calculate_usage_metrics(self, property):
+    def calculate_usage_metrics(self, property, today=None):
         """Calculate property usage metrics"""
-        today = datetime.now().date()
-        thirty_days_ago = today - timedelta(days=30)
+        today = today or datetime.now().date()
         ninety_days_ago = today - timedelta(days=90)
 
         # Get recent bookings
-        recent_bookings = Booking.objects.filter(
+        recent_stays = Booking.objects.filter(
             rental_property=property,
             check_in_date__gte=ninety_days_ago,
-            status__in=['confirmed', 'checked_in', 'checked_out']
-        )
+            status__in=self.USAGE_BOOKING_STATUSES
+        ).values_list('check_in_date', 'check_out_date', 'num_guests')
 
-        # Calculate metrics
-        bookings_30_days = recent_bookings.filter(
-            check_in_date__gte=thirty_days_ago
-        ).count()
+        return self._usage_metrics(list(recent_stays), today)
 
-        total_guests = sum(booking.num_guests for booking in recent_bookings)
+    def _usage_metrics(self, stays, today):
+        """Usage metrics from (check_in_date, check_out_date, num_guests) rows of the last 90 days"""
+        thirty_days_ago = today - timedelta(days=30)
+        ninety_days_ago = today - timedelta(days=90)
 
-        # Calculate occupancy rate
+        bookings_30_days = 0
+        total_guests = 0
         booked_days = 0
-        for booking in recent_bookings:
-            if booking.check_out_date >= ninety_days_ago:
-                start = max(booking.check_in_date, ninety_days_ago)
-                end = min(booking.check_out_date, today)
-                booked_days += (end - start).days + 1
+        if stays:
+            check_ins, check_outs, guests = zip(*stays)
+            starts = np.array(check_ins, dtype='datetime64[D]')
+            ends = np.array(check_outs, dtype='datetime64[D]')
+
+            # Calculate metrics
+            bookings_30_days = int((starts >= np.datetime64(thirty_days_ago)).sum())
+            total_guests = sum(guests)
+
+            # Calculate occupancy rate from the stay dates clipped to the 90-day window
+            in_window = ends >= np.datetime64(ninety_days_ago)
+            overlap = (
+                np.minimum(ends, np.datetime64(today)) - np.maximum(starts, np.datetime64(ninety_days_ago))
+            ).astype(np.int64) + 1
+            booked_days = int(overlap[in_window].sum())
 
         occupancy_rate = booked_days / 90.0
 
@@ -156,20 +192,28 @@ class MaintenancePredictor:
 
     def get_last_maintenance_dates(self, property):
         """Get last maintenance date for each type"""
-        last_dates = {}
-
-        # Get completed maintenance tasks
+        # Get completed maintenance tasks, newest first
         tasks = MaintenanceTask.objects.filter(
             rental_property=property,
             status='completed'
-        ).order_by('-completed_date')
+        ).order_by('-completed_date').values_list('title', 'completed_date')
+
+        return self._last_maintenance_dates(tasks.iterator())
+
+    def _last_maintenance_dates(self, tasks):
+        """Last maintenance date per type from (title, completed_date) rows, newest first"""
+        last_dates = {}
 
-        for task in tasks:
+        for title, completed_date in tasks:
             # Extract maintenance type from title
-            for mtype in self.MAINTENANCE_SCHEDULES.keys():
-                if mtype.lower() in task.title.lower():
-                    if mtype not in last_dates:
-                        last_dates[mtype] = task.completed_date
+            title_lower = title.lower()
+            for mtype_lower, mtype in self.SCHEDULE_TYPES_LOWER.items():
+                if mtype_lower in title_lower:
+                    last_dates.setdefault(mtype, completed_date)
+
+            # Stop once every type has its most recent date
+            if len(last_dates) == len(self.SCHEDULE_TYPES_LOWER):
+                break
 
         return last_dates
 
@@ -190,9 +234,9 @@ class MaintenancePredictor:
 
         return base_factor
 
-    def calculate_seasonal_factor(self, maintenance_type):
+    def calculate_seasonal_factor(self, maintenance_type, current_season=None):
         """Calculate seasonal impact factor"""
-        current_season = self.get_current_season()
+        current_season = current_season or self.get_current_season()
         seasonal_items = self.failure_patterns['seasonal'].get(current_season, [])
 
         if maintenance_type in seasonal_items:
@@ -200,22 +244,18 @@ class MaintenancePredictor:
 
         return 1.0
 
-    def calculate_age_factor(self, property):
+    def calculate_age_factor(self, property, today=None):
         """Calculate property age impact factor"""
-        # This would ideally use actual property age
-        # For now, we'll use a random factor
-        property_age_years = random.choice([1, 3, 6])
-
-        if property_age_years <= 2:
-            return self.failure_patterns['age_factor']['new']
-        elif property_age_years <= 5:
-            return self.failure_patterns['age_factor']['moderate']
-        else:
-            return self.failure_patterns['age_factor']['old']
+        # Property age as tracked in the system; there is no construction year on record
+        property_age_years = ((today or datetime.now().date()) - property.created_at.date()).days / 365
+
+        # new: 0-2 years, moderate: 2-5 years, old: 5+ years
+        age_band = ('new', 'moderate', 'old')[bisect_left(self.AGE_BAND_YEARS, property_age_years)]
+        return self.failure_patterns['age_factor'][age_band]
 
-    def get_current_season(self):
+    def get_current_season(self, today=None):
         """Get current season"""
-        month = datetime.now().month
+        month = (today or datetime.now().date()).month
         if month in [12, 1, 2]:
             return 'winter'
         elif month in [3, 4, 5]:
@@ -255,11 +295,45 @@ class MaintenancePredictor:
 
     def get_upcoming_maintenance(self, properties):
         """Get upcoming maintenance for multiple properties"""
-        all_predictions = []
-
-        for property in properties:
-            predictions = self.predict_maintenance_needs(property)
-            all_predictions.extend(predictions)
+        today = datetime.now().date()
+        keys = {prediction_cache_key(property.pk, today): property for property in properties}
+        cached_predictions = cache.get_many(keys)
+
+        # Predict uncached properties from one bookings query and one maintenance tasks query
+        missing = [property for key, property in keys.items() if key not in cached_predictions]
+        if missing:
+            stays_by_property = defaultdict(list)
+            for property_id, check_in, check_out, num_guests in Booking.objects.filter(
+                rental_property__in=missing,
+                check_in_date__gte=today - timedelta(days=90),
+                status__in=self.USAGE_BOOKING_STATUSES
+            ).values_list('rental_property_id', 'check_in_date', 'check_out_date', 'num_guests'):
+                stays_by_property[property_id].append((check_in, check_out, num_guests))
+
+            tasks_by_property = defaultdict(list)
+            for property_id, title, completed_date in MaintenanceTask.objects.filter(
+                rental_property__in=missing,
+                status='completed'
+            ).order_by('-completed_date').values_list('rental_property_id', 'title', 'completed_date'):
+                tasks_by_property[property_id].append((title, completed_date))
+
+            fresh_predictions = {
+                prediction_cache_key(property.pk, today): self._predict_maintenance_needs(
+                    property,
+                    self._usage_metrics(stays_by_property[property.pk], today),
+                    self._last_maintenance_dates(tasks_by_property[property.pk]),
+                    today
+                )
+                for property in missing
+            }
+            cache.set_many(fresh_predictions, settings.MAINTENANCE_PREDICTION_CACHE_TTL)
+            cached_predictions.update(fresh_predictions)
+
+        all_predictions = [
+            dict(prediction, property=property)
+            for key, property in keys.items()
+            for prediction in cached_predictions[key]
+        ]
 
         # Sort by urgency
         all_predictions.sort(key=lambda x: (x['days_until'], -x['confidence']))
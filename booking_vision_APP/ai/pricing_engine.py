@@ -11,6 +11,8 @@ import joblib
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 import logging
+from django.db.models import DurationField, ExpressionWrapper, Sum, Value
+from django.db.models.functions import Greatest, Least
 from django.utils import timezone
 
 from ..models.properties import Property
@@ -19,6 +21,9 @@ from ..models.ai_models import MarketData, PricingRule
 
 logger = logging.getLogger(__name__)
 
+# Random generator for synthetic training data
+_rng = np.random.default_rng(42)
+
 
 class PricingEngine:
     """AI-powered dynamic pricing engine"""
@@ -65,45 +70,40 @@ class PricingEngine:
     def generate_training_data(self):
         """Generate synthetic training data"""
         # Features: occupancy_rate, days_ahead, day_of_week, season, local_events, competitor_avg
-        features = []
-        prices = []
-
-        for _ in range(1000):
-            occupancy = np.random.uniform(0.3, 0.95)
-            days_ahead = np.random.randint(0, 180)
-            day_of_week = np.random.randint(0, 7)
-            season = np.random.randint(0, 4)
-            local_events = np.random.randint(0, 3)
-            competitor_avg = np.random.uniform(80, 300)
+        n = 1000
+        occupancy = _rng.uniform(0.3, 0.95, n)
+        days_ahead = _rng.integers(0, 180, n)
+        day_of_week = _rng.integers(0, 7, n)
+        season = _rng.integers(0, 4, n)
+        local_events = _rng.integers(0, 3, n)
+        competitor_avg = _rng.uniform(80, 300, n)
 
-            # Base price with variations
-            base_price = 150
+        # Base price with variations
+        base_price = 150
 
-            # Occupancy factor (higher occupancy = higher price)
-            occupancy_factor = 1 + (occupancy - 0.6) * 0.5
+        # Occupancy factor (higher occupancy = higher price)
+        occupancy_factor = 1 + (occupancy - 0.6) * 0.5
 
-            # Days ahead factor (last minute = higher price)
-            days_factor = 1.2 if days_ahead < 7 else 1.0
+        # Days ahead factor (last minute = higher price)
+        days_factor = np.where(days_ahead < 7, 1.2, 1.0)
 
-            # Weekend factor
-            weekend_factor = 1.2 if day_of_week in [5, 6] else 1.0
-
-            # Season factor
-            season_factor = [0.8, 1.0, 1.3, 0.9][season]
+        # Weekend factor
+        weekend_factor = np.where(day_of_week >= 5, 1.2, 1.0)
 
-            # Event factor
-            event_factor = 1 + (local_events * 0.15)
+        # Season factor
+        season_factor = np.array([0.8, 1.0, 1.3, 0.9])[season]
 
-            # Competitor factor
-            competitor_factor = competitor_avg / 150
+        # Event factor
+        event_factor = 1 + (local_events * 0.15)
 
-            # Calculate final price
-            price = base_price * occupancy_factor * days_factor * weekend_factor * season_factor * event_factor * competitor_factor
+        # Competitor factor
+        competitor_factor = competitor_avg / 150
 
-            features.append([occupancy, days_ahead, day_of_week, season, local_events, competitor_avg])
-            prices.append(price)
+        # Calculate final price
+        prices = base_price * occupancy_factor * days_factor * weekend_factor * season_factor * event_factor * competitor_factor
 
-        return np.array(features), np.array(prices)
+        features = np.column_stack([occupancy, days_ahead, day_of_week, season, local_events, competitor_avg])
+        return features, prices
 
     def get_pricing_recommendation(self, property):
         """Get AI-powered pricing recommendation for a property"""
@@ -144,19 +144,20 @@ class PricingEngine:
         today = timezone.now().date()
         thirty_days_ago = today - timedelta(days=30)
 
-        bookings = Booking.objects.filter(
+        # Inclusive overlap of each stay with the window; the filter guarantees every overlap is non-empty
+        booked = Booking.objects.filter(
             rental_property=property,
             check_in_date__lte=today,
             check_out_date__gte=thirty_days_ago,
             status__in=['confirmed', 'checked_in', 'checked_out']
-        )
-
-        booked_days = 0
-        for booking in bookings:
-            overlap_start = max(booking.check_in_date, thirty_days_ago)
-            overlap_end = min(booking.check_out_date, today)
-            if overlap_start <= overlap_end:
-                booked_days += (overlap_end - overlap_start).days + 1
+        ).aggregate(
+            booked=Sum(ExpressionWrapper(
+                Least('check_out_date', Value(today)) - Greatest('check_in_date', Value(thirty_days_ago))
+                + timedelta(days=1),
+                output_field=DurationField()
+            ))
+        )['booked']
+        booked_days = booked / timedelta(days=1) if booked else 0
 
         occupancy_rate = booked_days / 30.0
 
@@ -6,10 +6,38 @@ Location: booking_vision_APP/ai/sentiment_analysis.py
 from textblob import TextBlob
 import re
 import logging
-from typing import Dict, List
+from typing import Dict, List, Set
 
 logger = logging.getLogger(__name__)
 
+# Text cleaning patterns
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class KeywordMatcher:
+    """Finds every keyword contained in a text with a single regex scan"""
+
+    def __init__(self, keywords):
+        keywords = set(keywords)
+        # The lookahead reports overlapping hits, longest keyword first at each position,
+        # and each hit expands to the keywords it starts with
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(sorted(map(re.escape, keywords), key=len, reverse=True)) + '))'
+        )
+        self._prefixes = {
+            keyword: tuple(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords contained in text"""
+        hits = set()
+        for match in self._pattern.findall(text):
+            hits.update(self._prefixes[match])
+        return hits
+
 
 class SentimentAnalyzer:
     """AI system for analyzing sentiment in guest communications"""
@@ -56,6 +84,10 @@ class SentimentAnalyzer:
             ]
         }
 
+        self._keyword_matcher = KeywordMatcher(
+            keyword for keywords in self.keywords.values() for keyword in keywords
+        )
+
     def analyze(self, text: str) -> Dict:
         """Analyze sentiment of text message"""
         if not text or not text.strip():
@@ -84,14 +116,15 @@ class SentimentAnalyzer:
             sentiment = 'neutral'
 
         # Enhance with keyword analysis
-        keyword_sentiment, found_keywords = self.analyze_keywords(cleaned_text)
+        keyword_hits = self.find_keywords(cleaned_text)
+        keyword_sentiment, found_keywords = self.analyze_keywords(cleaned_text, keyword_hits)
 
         # Adjust sentiment based on keywords
         if keyword_sentiment:
             sentiment = keyword_sentiment
 
         # Check for urgency
-        urgency = self.detect_urgency(cleaned_text)
+        urgency = self.detect_urgency(cleaned_text, keyword_hits)
 
         # Calculate confidence
         confidence = self.calculate_confidence(polarity, found_keywords, text)
@@ -114,27 +147,32 @@ class SentimentAnalyzer:
         text = text.lower()
 
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = _URL_RE.sub('', text)
 
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = _EMAIL_RE.sub('', text)
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
 
         return text
 
-    def analyze_keywords(self, text: str) -> tuple:
+    def find_keywords(self, text: str) -> Set[str]:
+        """Find every sentiment and urgency keyword contained in text"""
+        return self._keyword_matcher.find(text)
+
+    def analyze_keywords(self, text: str, keyword_hits: Set[str] = None) -> tuple:
         """Analyze text for sentiment keywords"""
         found_keywords = []
         sentiment_scores = {'positive': 0, 'negative': 0}
 
-        words = text.split()
+        if keyword_hits is None:
+            keyword_hits = self.find_keywords(text)
 
         for category, keywords in self.keywords.items():
             if category in ['positive', 'negative']:
                 for keyword in keywords:
-                    if keyword in text:
+                    if keyword in keyword_hits:
                         found_keywords.append(keyword)
                         sentiment_scores[category] += 1
 
@@ -146,11 +184,13 @@ class SentimentAnalyzer:
         else:
             return None, found_keywords
 
-    def detect_urgency(self, text: str) -> bool:
+    def detect_urgency(self, text: str, keyword_hits: Set[str] = None) -> bool:
         """Detect if message requires urgent attention"""
-        for keyword in self.keywords['urgency']:
-            if keyword in text:
-                return True
+        if keyword_hits is None:
+            keyword_hits = self.find_keywords(text)
+
+        if any(keyword in keyword_hits for keyword in self.keywords['urgency']):
+            return True
 
         # Check for multiple exclamation marks
         if text.count('!') >= 2:
@@ -226,22 +266,24 @@ class SentimentAnalyzer:
         return f"{greeting}\n\n{response_body}{closing}"
 
     def batch_analyze(self, messages: List[str]) -> List[Dict]:
-        """Analyze multiple messages at once"""
+        """Analyze multiple messages at once, analysing each distinct text only once"""
+        analyses = {}
         results = []
         for message in messages:
-            try:
-                analysis = self.analyze(message)
-                results.append(analysis)
-            except Exception as e:
-                logger.error(f"Error analyzing message: {str(e)}")
-                results.append({
-                    'sentiment': 'neutral',
-                    'score': 0.0,
-                    'confidence': 0.0,
-                    'urgency': False,
-                    'keywords': [],
-                    'suggestions': [],
-                    'error': str(e)
-                })
+            if message not in analyses:
+                try:
+                    analyses[message] = self.analyze(message)
+                except Exception as e:
+                    logger.error(f"Error analyzing message: {str(e)}")
+                    analyses[message] = {
+                        'sentiment': 'neutral',
+                        'score': 0.0,
+                        'confidence': 0.0,
+                        'urgency': False,
+                        'keywords': [],
+                        'suggestions': [],
+                        'error': str(e)
+                    }
+            results.append(dict(analyses[message]))
 
         return results
\ No newline at end of file
@@ -5,7 +5,8 @@ Location: booking_vision_APP/api_views.py
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
-from django.db.models import Sum, Count, Avg
+from django.db.models import Sum, Count, Avg, Q, Value, DurationField, ExpressionWrapper
+from django.db.models.functions import Greatest, Least
 from django.utils import timezone
 from datetime import timedelta
 import json
@@ -26,37 +27,38 @@ def dashboard_stats_api(request):
     # Get bookings
     bookings = Booking.objects.filter(rental_property__owner=user)
 
-    # Calculate total revenue
-    total_revenue = bookings.filter(
-        status__in=['confirmed', 'checked_out']
-    ).aggregate(Sum('total_price'))['total_price__sum'] or 0
-
-    # Calculate occupancy rate for last 30 days
     today = timezone.now().date()
     thirty_days_ago = today - timedelta(days=30)
 
-    total_property_days = properties.count() * 30
-    booked_days = 0
-
-    for property in properties:
-        property_bookings = bookings.filter(
-            rental_property=property,
-            status__in=['confirmed', 'checked_in', 'checked_out'],
-            check_in_date__lte=today,
-            check_out_date__gte=thirty_days_ago
+    # Booking count, total revenue and booked days of active properties over the last 30 days, in one query
+    booking_totals = bookings.aggregate(
+        total_bookings=Count('id'),
+        total_revenue=Sum('total_price', filter=Q(status__in=['confirmed', 'checked_out'])),
+        booked=Sum(
+            ExpressionWrapper(
+                Least('check_out_date', Value(today)) - Greatest('check_in_date', Value(thirty_days_ago))
+                + timedelta(days=1),
+                output_field=DurationField()
+            ),
+            filter=Q(
+                rental_property__is_active=True,
+                status__in=['confirmed', 'checked_in', 'checked_out'],
+                check_in_date__lte=today,
+                check_out_date__gte=thirty_days_ago
+            )
         )
+    )
+    total_revenue = booking_totals['total_revenue'] or 0
+    booked_days = booking_totals['booked'] / timedelta(days=1) if booking_totals['booked'] else 0
 
-        for booking in property_bookings:
-            overlap_start = max(booking.check_in_date, thirty_days_ago)
-            overlap_end = min(booking.check_out_date, today)
-            if overlap_start <= overlap_end:
-                booked_days += (overlap_end - overlap_start).days + 1
-
+    # Calculate occupancy rate for last 30 days
+    total_properties = properties.count()
+    total_property_days = total_properties * 30
     occupancy_rate = round((booked_days / total_property_days * 100) if total_property_days > 0 else 0, 1)
 
     return JsonResponse({
-        'total_properties': properties.count(),
-        'total_bookings': bookings.count(),
+        'total_properties': total_properties,
+        'total_bookings': booking_totals['total_bookings'],
         'total_revenue': float(total_revenue),
         'occupancy_rate': occupancy_rate
     })
@@ -116,11 +118,8 @@ def toggle_ai_feature(request, feature):
         if feature not in feature_map:
             return JsonResponse({'error': 'Invalid feature'}, status=400)
 
-        # Update all user properties
-        properties = Property.objects.filter(owner=request.user)
-        for property in properties:
-            setattr(property, feature_map[feature], enabled)
-            property.save()
+        # Update all user properties in one statement
+        Property.objects.filter(owner=request.user).set_feature_flag(feature_map[feature], enabled)
 
         return JsonResponse({
             'success': True,
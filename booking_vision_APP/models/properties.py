@@ -5,6 +5,7 @@ This file defines all property-related database models.
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 
 
 class Amenity(models.Model):
@@ -37,6 +38,15 @@ class Amenity(models.Model):
         return self.name
 
 
+class PropertyQuerySet(models.QuerySet):
+    """Bulk operations on properties"""
+
+    def set_feature_flag(self, field, enabled):
+        """Set an AI feature flag on every property in one UPDATE, returning the row count"""
+        # update() skips auto_now, so updated_at is set here
+        return self.update(**{field: enabled}, updated_at=timezone.now())
+
+
 class Property(models.Model):
     """Model representing a rental property"""
     PROPERTY_TYPES = [
@@ -83,6 +93,8 @@ class Property(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    objects = PropertyQuerySet.as_manager()
+
     class Meta:
         verbose_name_plural = "Properties"
         ordering = ['-created_at']
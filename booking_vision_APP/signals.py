@@ -1,8 +1,9 @@
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.contrib.auth.models import User
 from django.dispatch import receiver
 from django.db.models import Q
-from .models import Guest, UserProfile
+from .models import Guest, MaintenanceTask, PricingRule, Property, UserProfile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -153,4 +154,20 @@ def link_guest_on_profile_update(sender, instance, created, **kwargs):
                 logger.info(f"Linked guest {guest_to_link} to user {instance.user.username} after profile update")
 
         except Exception as e:
-            logger.error(f"Error linking guest on profile update: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error linking guest on profile update: {str(e)}")
+
+
+@receiver([post_save, post_delete], sender=MaintenanceTask)
+def invalidate_maintenance_predictions(sender, instance, **kwargs):
+    """Drop the cached maintenance predictions of the task's property"""
+    from .ai.maintenance_predictor import prediction_cache_key
+    cache.delete(prediction_cache_key(instance.rental_property_id))
+
+
+@receiver([post_save, post_delete], sender=PricingRule)
+def invalidate_pricing_intelligence(sender, instance, **kwargs):
+    """Drop the owner's cached BI pricing sections when one of their rules changes"""
+    from .ai.business_intelligence import pricing_cache_keys
+    owner_id = Property.objects.filter(pk=instance.rental_property_id).values_list('owner_id', flat=True).first()
+    if owner_id is not None:
+        cache.delete_many(pricing_cache_keys(owner_id))
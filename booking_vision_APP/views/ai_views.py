@@ -342,11 +342,8 @@ class AIToggleAPIView(LoginRequiredMixin, View):
         if feature not in feature_map:
             return JsonResponse({'error': 'Invalid feature'}, status=400)
 
-        # Update all user properties
-        properties = Property.objects.filter(owner=request.user)
-        for property in properties:
-            setattr(property, feature_map[feature], enabled)
-            property.save()
+        # Update all user properties in one statement
+        Property.objects.filter(owner=request.user).set_feature_flag(feature_map[feature], enabled)
 
         return JsonResponse({
             'success': True,
@@ -30,26 +30,31 @@ def dashboard_stats_api(request):
     properties = Property.objects.filter(owner=user, is_active=True)
     bookings = Booking.objects.filter(rental_property__owner=user)
 
-    total_revenue = bookings.filter(
-        status__in=['confirmed', 'checked_out']
-    ).aggregate(Sum('total_price'))['total_price__sum'] or 0
+    # Booking count, revenue and recently active bookings in one query
+    booking_totals = bookings.aggregate(
+        total_bookings=Count('id'),
+        total_revenue=Sum('total_price', filter=Q(status__in=['confirmed', 'checked_out'])),
+        active_bookings=Count('id', filter=Q(
+            status__in=['confirmed', 'checked_in'],
+            check_in_date__lte=today,
+            check_out_date__gte=today - timedelta(days=30)
+        ))
+    )
+    total_revenue = booking_totals['total_revenue'] or 0
 
     # Calculate occupancy rate
-    total_property_days = properties.count() * 30
+    total_properties = properties.count()
+    total_property_days = total_properties * 30
     if total_property_days > 0:
         # Simplified calculation for now
-        active_bookings = bookings.filter(
-            status__in=['confirmed', 'checked_in'],
-            check_in_date__lte=today,
-            check_out_date__gte=today - timedelta(days=30)
-        ).count()
+        active_bookings = booking_totals['active_bookings']
         occupancy_rate = min(round((active_bookings / total_property_days * 100), 1), 100)
     else:
         occupancy_rate = 0
 
     return JsonResponse({
-        'total_properties': properties.count(),
-        'total_bookings': bookings.count(),
+        'total_properties': total_properties,
+        'total_bookings': booking_totals['total_bookings'],
         'total_revenue': float(total_revenue),
         'occupancy_rate': occupancy_rate
     })
@@ -280,13 +285,8 @@ def ai_toggle_api(request, feature):
         if feature not in feature_map:
             return JsonResponse({'error': 'Invalid feature'}, status=400)
 
-        # Update all user properties
-        properties = Property.objects.filter(owner=request.user)
-        updated = 0
-        for property in properties:
-            setattr(property, feature_map[feature], enabled)
-            property.save()
-            updated += 1
+        # Update all user properties in one statement
+        updated = Property.objects.filter(owner=request.user).set_feature_flag(feature_map[feature], enabled)
 
         return JsonResponse({
             'success': True,